@@ -0,0 +1,174 @@
+# Column-based versions of Employee and Rectangle for large batches.
+# Instead of one Python object per row, every field is one NumPy array,
+# so promotion() / calc_area() run over the whole batch in one step.
+# table[i] still gives back an Employee / Rectangle that reads and writes
+# the arrays (a "row view"), so code written for single objects still works.
+
+import csv
+import warnings
+
+import numpy as np
+
+from employee import Employee
+from rectangle import Rectangle
+
+
+class EmployeeRow(Employee):
+    # An Employee whose name and salary live in an EmployeeTable
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def name(self):
+        return self._table.names[self._row]
+
+    @name.setter
+    def name(self, value):
+        self._table.names[self._row] = value
+
+    @property
+    def salary(self):
+        return self._table.salaries[self._row].item()
+
+    @salary.setter
+    def salary(self, value):
+        self._table.salaries[self._row] = value
+
+    def __reduce__(self):
+        # Pickle as a plain Employee (the table is not sent along)
+        return (Employee, (self.name, self.salary))
+
+
+class EmployeeTable:
+    def __init__(self, names, salaries):
+        self.names = np.array(names, dtype=object)
+        self.salaries = np.array(salaries, dtype=np.float64)
+        if self.names.shape != self.salaries.shape:
+            raise ValueError("names and salaries must have the same length")
+
+    @classmethod
+    def from_employees(cls, employees):
+        employees = list(employees)
+        return cls([e.name for e in employees], [e.salary for e in employees])
+
+    @classmethod
+    def from_csv(cls, path):
+        # CSV with a header row: name,salary
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            names, salaries = [], []
+            for row in reader:
+                if row:
+                    names.append(row[0])
+                    salaries.append(float(row[1]))
+        return cls(names, salaries)
+
+    def to_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "salary"])
+            writer.writerows(zip(self.names.tolist(), self.salaries.tolist()))
+
+    def __len__(self):
+        return len(self.salaries)
+
+    def __getitem__(self, i):
+        if not -len(self) <= i < len(self):
+            raise IndexError("row out of range")
+        return EmployeeRow(self, i % len(self))
+
+    def __iter__(self):
+        return (EmployeeRow(self, i) for i in range(len(self)))
+
+    def promotion(self):
+        # Same as Employee.promotion for every row (returns the new salaries)
+        return self.salaries * 1.10
+
+    def apply_promotion(self):
+        # Give every row the raise in place
+        self.salaries *= 1.10
+
+
+class RectangleRow(Rectangle):
+    # A Rectangle whose width and length live in a RectangleBatch
+    __slots__ = ("_batch", "_row")
+
+    def __init__(self, batch, row):
+        self._batch = batch
+        self._row = row
+
+    @property
+    def width(self):
+        return self._batch.widths[self._row].item()
+
+    @width.setter
+    def width(self, value):
+        self._batch.widths[self._row] = value
+
+    @property
+    def length(self):
+        return self._batch.lengths[self._row].item()
+
+    @length.setter
+    def length(self, value):
+        self._batch.lengths[self._row] = value
+
+    def __reduce__(self):
+        # Pickle as a plain Rectangle (the batch is not sent along)
+        return (Rectangle, (self.width, self.length))
+
+
+class RectangleBatch:
+    def __init__(self, widths, lengths):
+        self.widths = np.array(widths, dtype=np.float64)
+        self.lengths = np.array(lengths, dtype=np.float64)
+        if self.widths.shape != self.lengths.shape:
+            raise ValueError("widths and lengths must have the same length")
+
+    @classmethod
+    def from_rectangles(cls, rectangles):
+        rectangles = list(rectangles)
+        return cls([r.width for r in rectangles], [r.length for r in rectangles])
+
+    @classmethod
+    def from_csv(cls, path):
+        # CSV with a header row: width,length
+        # A header-only file (empty batch) is fine: loadtxt warns and gives
+        # shape (0, 1), so silence the warning and reshape to (0, 2)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="loadtxt: input contained no data")
+            data = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2).reshape(-1, 2)
+        return cls(data[:, 0], data[:, 1])
+
+    def to_csv(self, path):
+        data = np.column_stack([self.widths, self.lengths])
+        np.savetxt(path, data, delimiter=",", header="width,length", comments="", fmt="%.17g")
+
+    def __len__(self):
+        return len(self.widths)
+
+    def __getitem__(self, i):
+        if not -len(self) <= i < len(self):
+            raise IndexError("row out of range")
+        return RectangleRow(self, i % len(self))
+
+    def __iter__(self):
+        return (RectangleRow(self, i) for i in range(len(self)))
+
+    def calc_area(self):
+        # Same as Rectangle.calc_area for every row
+        return self.widths * self.lengths
+
+
+if __name__ == "__main__":
+    staff = EmployeeTable(["John", "Ana", "Li"], [5000, 6200, 4800])
+    print("Updated salaries: ", staff.promotion())
+    print("Row view: ", staff[0].name, staff[0].promotion())
+
+    boxes = RectangleBatch([3, 2, 10], [5, 2, 0.5])
+    print("areas of rectangles: ", boxes.calc_area())
+    print("Row view: ", boxes[0].calc_area())
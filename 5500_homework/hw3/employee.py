@@ -1,10 +1,15 @@
-class Employee:
+from records import Record
+
+class Employee(Record):
+    __slots__ = ("name", "salary")
+
     def __init__ (self, name, salary):
         self.name = name
         self.salary = salary
     def promotion(self):
         return (self.salary*1.10)
 
-John = Employee("John", 5000)
+if __name__ == "__main__":
+    John = Employee("John", 5000)
 
-print ("Updated salary: ", John.promotion())
+    print ("Updated salary: ", John.promotion())
@@ -1,5 +1,29 @@
-class Pet:
-    species = "unknown"
+from sys import intern
+
+from records import Record
+
+class _Species:
+    # The Pet.species attribute. Like the old class default, it reads
+    # "unknown" on the class and on a pet whose species was never set.
+    # Setting it also stores the lowercase key lifespan() looks up.
+    def __get__(self, pet, owner=None):
+        if pet is None:
+            return "unknown"
+        try:
+            return pet._species
+        except AttributeError:
+            return "unknown"
+
+    def __set__(self, pet, value):
+        pet._species = value
+        pet._species_key = intern(value.lower()) if isinstance(value, str) else None
+
+class Pet(Record):
+    # The lowercase lookup key for species is computed once (in __init__ or
+    # when species is reassigned), not on every lifespan() call
+    __slots__ = ("name", "age", "_species", "_species_key")
+    _fields = ("name", "age", "species")
+    species = _Species()
 
     species_avg_lifespan = {
         "dog": 12,
@@ -16,12 +40,18 @@ class Pet:
     def __init__(self, name, age, species):
         self.name = name
         self.age = age
-        self.species = species
+        self._species = species
+        # one shared copy per species; None if species is not a str
+        self._species_key = intern(species.lower()) if isinstance(species, str) else None
     def human_age (self):
         return (self.age * 7)
     def lifespan(self):
-        return self.species_avg_lifespan.get(self.species.lower(), "unknown")
+        key = getattr(self, "_species_key", None)
+        if key is None:
+            key = self.species.lower()  # not a str: fails here, like before
+        return self.species_avg_lifespan.get(key, "unknown")
 
-Pet1 = Pet("Scout", 4, "dog")
+if __name__ == "__main__":
+    Pet1 = Pet("Scout", 4, "dog")
 
-print (Pet1.name, "is about ", Pet1.human_age(), "years old in human years. Their lifespan in animal years is about ", Pet1.lifespan())
\ No newline at end of file
+    print (Pet1.name, "is about ", Pet1.human_age(), "years old in human years. Their lifespan in animal years is about ", Pet1.lifespan())
\ No newline at end of file
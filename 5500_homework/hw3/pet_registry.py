@@ -0,0 +1,110 @@
+# A registry of many pets stored as NumPy columns.
+# Pet.lifespan lowercases the species and looks it up in a dict on every
+# call. Here each distinct species string is lowercased once and turned into
+# a small integer code, and the lifespans are kept in an array indexed by
+# that code, so lifespan() for a million pets is one array lookup.
+# human_age() and per-species summaries are vectorized the same way.
+# Unknown species get NaN as their lifespan (Pet.lifespan says "unknown").
+# registry[i] gives back the Pet as it was given (original species spelling;
+# age as int if all ages were ints, float otherwise).
+
+import csv
+
+import numpy as np
+
+from pet import Pet
+
+
+class PetRegistry:
+    def __init__(self, names, ages, species):
+        self.names = np.array(names, dtype=object)
+        self.ages = np.array(ages)
+        if self.ages.dtype.kind not in "iuf":
+            self.ages = self.ages.astype(np.float64)
+        raw = np.array(species, dtype=str)
+        if not (len(self.names) == len(self.ages) == len(raw)):
+            raise ValueError("names, ages and species must have the same length")
+
+        # Intern: every distinct spelling is lowercased once, and spellings
+        # that lowercase to the same species share one code
+        self.species_codes = {}   # lowercase species -> code
+        self.species_names = []   # code -> lowercase species
+        spellings, inverse = np.unique(raw, return_inverse=True)
+        spelling_codes = np.array([self._intern(s) for s in spellings.tolist()], dtype=np.int32)
+        # Each row's original spelling, kept for registry[i]
+        self.spellings = spellings.tolist()
+        self.spelling_index = inverse.reshape(-1).astype(np.int32)
+        self.codes = spelling_codes[self.spelling_index] if len(raw) else np.zeros(0, np.int32)
+
+        # Lifespan per species code (NaN when the species is not in Pet's table)
+        table = Pet.species_avg_lifespan
+        self.lifespans = np.array([table.get(s, np.nan) for s in self.species_names], dtype=np.float64)
+
+    def _intern(self, species):
+        key = species.lower()
+        if key not in self.species_codes:
+            self.species_codes[key] = len(self.species_names)
+            self.species_names.append(key)
+        return self.species_codes[key]
+
+    @classmethod
+    def from_pets(cls, pets):
+        pets = list(pets)
+        return cls([p.name for p in pets], [p.age for p in pets], [p.species for p in pets])
+
+    @classmethod
+    def from_csv(cls, path):
+        # CSV with a header row: name,age,species
+        names, ages, species = [], [], []
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                if row:
+                    names.append(row[0])
+                    ages.append(row[1])
+                    species.append(row[2])
+        # Ages stay ints if every one is written as an int, like the constructor
+        try:
+            ages = [int(age) for age in ages]
+        except ValueError:
+            ages = [float(age) for age in ages]
+        return cls(names, ages, species)
+
+    def __len__(self):
+        return len(self.ages)
+
+    def __getitem__(self, i):
+        # One record as a regular Pet, with the species spelled as given
+        return Pet(self.names[i], self.ages[i].item(), self.spellings[self.spelling_index[i]])
+
+    def human_age(self):
+        # Same as Pet.human_age for every pet
+        return self.ages * 7
+
+    def lifespan(self):
+        # Same as Pet.lifespan for every pet, with NaN instead of "unknown"
+        return self.lifespans[self.codes]
+
+    def species_summary(self):
+        # Group by species: count, average age, average human age, lifespan
+        n = len(self.species_names)
+        counts = np.bincount(self.codes, minlength=n)
+        age_sums = np.bincount(self.codes, weights=self.ages, minlength=n)
+        summary = {}
+        for code, species in enumerate(self.species_names):
+            mean_age = age_sums[code] / counts[code]
+            summary[species] = {
+                "count": int(counts[code]),
+                "mean_age": float(mean_age),
+                "mean_human_age": float(mean_age * 7),
+                "lifespan": float(self.lifespans[code]),
+            }
+        return summary
+
+
+if __name__ == "__main__":
+    shelter = PetRegistry(["Scout", "Milo", "Kiwi", "Rex"], [4, 2, 30, 9], ["dog", "Cat", "parrot", "DOG"])
+    print("Human ages: ", shelter.human_age())
+    print("Lifespans: ", shelter.lifespan())
+    print("By species: ", shelter.species_summary())
@@ -0,0 +1,133 @@
+# A small base class for "record" style model classes (Employee, Rectangle,
+# Pet). A plain class gives every object its own __dict__, which is
+# the biggest part of its memory. A Record subclass lists its attributes
+# in __slots__ instead, so each object is just a fixed row of fields.
+#
+# Record also gives every subclass:
+#   - __init__ that fills the fields in order (if the class has no own one)
+#   - a readable __repr__
+#   - compact pickling: just the class and a tuple of field values, which
+#     keeps objects small when sent to a process pool
+# == and hash() stay the default (by identity), like a plain class.
+#
+# _fields is the list of public fields, in constructor order. By default it
+# is every __slots__ name not starting with "_"; a class that stores a field
+# through a property can set _fields itself (see Pet).
+
+class Record:
+    __slots__ = ()
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_fields" not in cls.__dict__:
+            fields = []
+            for klass in reversed(cls.__mro__):
+                for name in klass.__dict__.get("__slots__", ()):
+                    if not name.startswith("_") and name not in fields:
+                        fields.append(name)
+            cls._fields = tuple(fields)
+
+    def __init__(self, *args, **kwargs):
+        fields = self._fields
+        if not kwargs and len(args) == len(fields):
+            # Common case: every field given in order
+            for name, value in zip(fields, args):
+                setattr(self, name, value)
+            return
+        if len(args) > len(self._fields):
+            raise TypeError(f"{type(self).__name__} takes at most {len(self._fields)} arguments")
+        values = dict(zip(self._fields, args))
+        for name, value in kwargs.items():
+            if name not in self._fields or name in values:
+                raise TypeError(f"{type(self).__name__} got an unexpected or repeated argument {name!r}")
+            values[name] = value
+        for name in self._fields:
+            if name not in values:
+                raise TypeError(f"{type(self).__name__} missing argument {name!r}")
+            setattr(self, name, values[name])
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def _asdict(self):
+        return dict(zip(self._fields, self._values()))
+
+    def __repr__(self):
+        args = ", ".join(f"{name}={value!r}" for name, value in zip(self._fields, self._values()))
+        return f"{type(self).__name__}({args})"
+
+    def __reduce__(self):
+        # Pickle as (class, field values): rebuilt with cls(*values)
+        return (type(self), self._values())
+
+
+if __name__ == "__main__":
+    # Memory / speed benchmark: the original dict-based classes vs the
+    # __slots__ versions (Records, and hw4's Card).  python records.py [count]
+    import os
+    import pickle
+    import sys
+    import time
+    import tracemalloc
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "hw4"))
+    from employee import Employee
+    from rectangle import Rectangle
+    from pet import Pet
+    from DeckOfCards import Card
+
+    # The classes as they were before (one __dict__ per object)
+    class OldEmployee:
+        def __init__(self, name, salary):
+            self.name = name
+            self.salary = salary
+
+    class OldRectangle:
+        def __init__(self, width, length):
+            self.width = width
+            self.length = length
+
+    class OldPet:
+        def __init__(self, name, age, species):
+            self.name = name
+            self.age = age
+            self.species = species
+
+    class OldCard:
+        def __init__(self, suit, face, value):
+            self.suit = suit
+            self.face = face
+            self.val = value
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    cases = [
+        ("Employee", OldEmployee, Employee, ("John", 5000)),
+        ("Rectangle", OldRectangle, Rectangle, (3, 5)),
+        ("Pet", OldPet, Pet, ("Scout", 4, "dog")),
+        ("Card", OldCard, Card, ("Hearts", "Ace", 11)),
+    ]
+
+    def measure(cls, args):
+        # Bytes per object (the argument values are shared, so not counted)
+        # and objects built per second
+        tracemalloc.start()
+        objs = [cls(*args) for _ in range(n)]
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del objs
+        start = time.perf_counter()
+        objs = [cls(*args) for _ in range(n)]
+        rate = n / (time.perf_counter() - start)
+        return (held - sys.getsizeof(objs)) / n, rate
+
+    print(f"{n:,} objects per class")
+    print(f"{'class':<11}{'bytes/obj':>18}{'built/s':>22}{'pickle bytes':>18}")
+    for label, old, new, args in cases:
+        old_bytes, old_rate = measure(old, args)
+        new_bytes, new_rate = measure(new, args)
+        old_pickle = len(pickle.dumps([old(*args) for _ in range(100)])) / 100
+        new_pickle = len(pickle.dumps([new(*args) for _ in range(100)])) / 100
+        rates = f"{old_rate / 1e6:.2f}M -> {new_rate / 1e6:.2f}M"
+        print(f"{label:<11}{old_bytes:>8.0f} -> {new_bytes:<6.0f}{rates:>22}"
+              f"{old_pickle:>8.0f} -> {new_pickle:<6.0f}")
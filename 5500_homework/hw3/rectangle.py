@@ -1,4 +1,8 @@
-class Rectangle:
+from records import Record
+
+class Rectangle(Record):
+    __slots__ = ("width", "length")
+
     def __init__(self, width, length):
         self.width = width
         self.length = length
@@ -6,6 +10,7 @@ class Rectangle:
     def calc_area(self):
         return (self.width*self.length)
 
-area = Rectangle(3, 5)
+if __name__ == "__main__":
+    area = Rectangle(3, 5)
 
-print ("area of rectangle: ", area.calc_area())
\ No newline at end of file
+    print ("area of rectangle: ", area.calc_area())
\ No newline at end of file
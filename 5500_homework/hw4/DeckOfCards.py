@@ -2,6 +2,10 @@ import random
 
 
 class Card():
+    # __slots__ keeps each card to three fields (no per-card __dict__),
+    # which matters when millions of cards are built
+    __slots__ = ("suit", "face", "val")
+
     def __init__(self, suit, face, value):
         self.suit = suit
         self.face = face
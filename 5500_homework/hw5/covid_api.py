@@ -1,10 +1,16 @@
 # hw5
 import os
+import sys
 import json
 from collections import defaultdict
 from datetime import datetime
 import cloudscraper
 
+# instrument.py (shared stage timing) lives one folder up. It is appended
+# to the end of sys.path, so that folder can't shadow any other module.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instrument import add_bytes, dump_from_env, timed
+
 # ---------- File locations ----------
 # HERE = the folder this .py file is in
 HERE = os.path.dirname(__file__)
@@ -38,6 +44,7 @@ def month_str(key_tuple):
 HERE = os.path.dirname(__file__)
 STATES_FILE = os.path.join(HERE, "states_territories-1.txt")
 
+@timed("load_states")
 def load_states():
     # Print out debug info so you know what folder/file it’s trying to read
     print(f"[debug] __file__ folder: {HERE}")
@@ -51,6 +58,7 @@ def load_states():
 
     # Try to print the first few lines of the file so you can check format
     try:
+        add_bytes(os.path.getsize(STATES_FILE))  # count bytes read for this stage
         with open(STATES_FILE, "r", encoding="utf-8") as f:
             peek = [next(f, "").rstrip("\n") for _ in range(5)]
         print("[debug] first lines in file:")
@@ -62,6 +70,7 @@ def load_states():
     # Now actually read all the states into a list
     states = []
     seen = set()  # keep track so we don’t add duplicates
+    add_bytes(os.path.getsize(STATES_FILE))  # count bytes read for this stage
     with open(STATES_FILE, "r", encoding="utf-8") as f:
         for raw in f:
             line = raw.strip()
@@ -106,6 +115,7 @@ def load_states():
 
 
 # ---------- Step 2: Fetch & Save JSON ----------
+@timed("fetch_and_save_all")
 def fetch_and_save_all(states):
     """
     For each state/territory, go to the API, grab the data, and save it into data/<code>.json.
@@ -120,6 +130,7 @@ def fetch_and_save_all(states):
         try:
             resp = scraper.get(url, timeout=30)  # ask for the data
             resp.raise_for_status()
+            add_bytes(len(resp.content))  # count bytes downloaded for this stage
             data = resp.json()  # turn response into Python list/dict
 
             outpath = os.path.join(DATA_DIR, f"{code}.json")
@@ -137,16 +148,19 @@ def fetch_and_save_all(states):
                 continue
 
 
+@timed("load_state_json")
 def load_state_json(code):
     """Open a saved JSON file for a state and load it into Python."""
     path = os.path.join(DATA_DIR, f"{code}.json")
     if not os.path.exists(path):
         return []
+    add_bytes(os.path.getsize(path))  # count bytes read for this stage
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
 # ---------- Step 3: Compute Stats ----------
+@timed("compute_stats")
 def compute_stats(records):
     """
     Do the math for averages, highest day, lowest month, etc.
@@ -266,4 +280,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # Write stage timings if HW_INSTRUMENT is set (see instrument.py),
+        # also when main() stopped with an error
+        dump_from_env()
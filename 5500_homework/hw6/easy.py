@@ -16,6 +16,8 @@ Deliverables in Github: Create a folder, hw6, in your private repo, and add the
 
 from typing import Iterable
 
+from vectorized import as_vector, vector_sum
+
 
 def sum_array(nums: Iterable[int]) -> int:
     """
@@ -28,7 +30,15 @@ def sum_array(nums: Iterable[int]) -> int:
         O(n) — we visit each element exactly once.
     Space Complexity:
         O(1) auxiliary space (ignoring input storage).
+
+    NumPy arrays, array.array and memoryview inputs are summed with NumPy
+    instead (see vectorized.py); integers are summed exactly, without
+    int64 overflow.
     """
+    arr = as_vector(nums)
+    if arr is not None:
+        return vector_sum(arr, nums)
+
     total = 0
     for x in nums:
         total += x
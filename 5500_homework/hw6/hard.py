@@ -16,6 +16,8 @@ Deliverables in Github: Create a folder, hw6, in your private repo, and add the
 
 from typing import Iterable
 
+from vectorized import as_vector, vector_max_difference
+
 
 def max_difference(nums: Iterable[int]) -> int:
     """
@@ -33,7 +35,14 @@ def max_difference(nums: Iterable[int]) -> int:
 
     Raises:
         ValueError if fewer than 2 elements are provided.
+
+    NumPy arrays, array.array and memoryview inputs use NumPy's min/max
+    instead of the loop (see vectorized.py).
     """
+    arr = as_vector(nums)
+    if arr is not None:
+        return vector_max_difference(arr, nums)
+
     iterator = iter(nums)
     try:
         first = next(iterator)
@@ -16,6 +16,8 @@ Deliverables in Github: Create a folder, hw6, in your private repo, and add the
 
 from typing import Iterable, Optional
 
+from vectorized import as_vector, vector_second_largest
+
 
 def second_largest(nums: Iterable[int]) -> Optional[int]:
     """
@@ -38,7 +40,14 @@ def second_largest(nums: Iterable[int]) -> Optional[int]:
         [5, 1, 7, 7, 3] -> 5   (largest=7, second largest=5)
         [2, 2, 2]       -> None (no second distinct)
         [9, -1]         -> -1
+
+    NumPy arrays, array.array and memoryview inputs use a vectorized
+    max / masked-max instead of the loop (see vectorized.py).
     """
+    arr = as_vector(nums)
+    if arr is not None:
+        return vector_second_largest(arr, nums)
+
     m1 = None  # largest
     m2 = None  # second largest
 
@@ -0,0 +1,152 @@
+"""
+Parallel sum_array / second_largest / max_difference over huge binary files.
+
+The input is a raw dump of fixed-width integers (for example written with
+numpy's ndarray.tofile). The file is memory-mapped, never read into RAM
+as a whole, and split into chunks. A process pool summarizes each chunk
+with NumPy and sends back only a tiny partial result (count, sum, min,
+max, two largest distinct values) as a StreamStats, and the partial
+results are merged. Throughput scales with the number of cores and the
+answers are exactly the ones the serial functions give on the same data.
+
+Usage:
+    parallel_sum_array("numbers.bin", dtype="<i8")
+    parallel_max_difference("numbers.bin", dtype="<i4", workers=8)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from stream_stats import StreamStats
+from vectorized import vector_sum
+
+# Items per chunk: 16M int64 values = 128 MB of file per task
+DEFAULT_CHUNK_ITEMS = 1 << 24
+
+
+def _chunks(path: str, dtype: np.dtype, chunk_items: int) -> List[Tuple[int, int]]:
+    """Split the file into (first item, item count) ranges."""
+    size = os.path.getsize(path)
+    if size % dtype.itemsize:
+        raise ValueError(f"File size {size} is not a multiple of {dtype.itemsize} bytes.")
+    total_items = size // dtype.itemsize
+    return [(start, min(chunk_items, total_items - start))
+            for start in range(0, total_items, chunk_items)]
+
+
+def _summarize_chunk(path: str, dtype: str, start: int, count: int) -> StreamStats:
+    """
+    Worker: memory-map one chunk of the file and summarize it with NumPy.
+
+    Time Complexity (Big-O):
+        O(count) — a few vectorized passes over the chunk.
+    """
+    arr = np.memmap(path, dtype=dtype, mode="r",
+                    offset=start * np.dtype(dtype).itemsize, shape=(count,))
+    largest = arr.max()
+    rest = arr[arr != largest]
+    top = [largest.item()] if rest.size == 0 else [largest.item(), rest.max().item()]
+    return StreamStats.from_parts(
+        count=count,
+        total=vector_sum(arr, arr),
+        minimum=arr.min().item(),
+        maximum=largest.item(),
+        top=top,
+    )
+
+
+def parallel_stats(path: str, dtype: str = "<i8", workers: Optional[int] = None,
+                   chunk_items: int = DEFAULT_CHUNK_ITEMS) -> StreamStats:
+    """
+    Summarize a binary integer file in parallel.
+
+    Args:
+        path: file of raw fixed-width integers.
+        dtype: NumPy dtype of the values, e.g. "<i8" (little-endian int64).
+        workers: processes to use (default: all cores). 1 runs in-process.
+        chunk_items: values per task.
+
+    Returns:
+        StreamStats for the whole file (k = 2).
+
+    Raises:
+        ValueError for non-integer dtypes (float sums would depend on the
+        chunking, so they could not match the serial loop exactly) or a
+        file whose size is not a whole number of values.
+    """
+    dt = np.dtype(dtype)
+    if dt.kind not in "iu":
+        raise ValueError("parallel_stats only supports integer dtypes.")
+    ranges = _chunks(path, dt, chunk_items)
+    if not ranges:
+        return StreamStats()
+
+    paths = [path] * len(ranges)
+    dtypes = [dt.str] * len(ranges)
+    starts = [start for start, _ in ranges]
+    counts = [count for _, count in ranges]
+
+    if workers == 1 or len(ranges) == 1:
+        parts = map(_summarize_chunk, paths, dtypes, starts, counts)
+        return reduce(StreamStats.merge, parts, StreamStats())
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(_summarize_chunk, paths, dtypes, starts, counts)
+        return reduce(StreamStats.merge, parts, StreamStats())
+
+
+def parallel_sum_array(path: str, **kwargs) -> int:
+    """Same answer as easy.sum_array on the file's values."""
+    return parallel_stats(path, **kwargs).total
+
+
+def parallel_second_largest(path: str, **kwargs) -> Optional[int]:
+    """Same answer as medium.second_largest on the file's values."""
+    return parallel_stats(path, **kwargs).second_largest()
+
+
+def parallel_max_difference(path: str, **kwargs) -> int:
+    """
+    Same answer as hard.max_difference on the file's values.
+
+    Raises:
+        ValueError if the file holds fewer than 2 values.
+    """
+    return parallel_stats(path, **kwargs).max_difference()
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+
+    from easy import sum_array
+    from hard import max_difference
+    from medium import second_largest
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000_000
+    path = os.path.join(tempfile.gettempdir(), "hw6_parallel_demo.bin")
+    rng = np.random.default_rng(5500)
+    rng.integers(-10**12, 10**12, n, dtype=np.int64).tofile(path)
+
+    try:
+        start = time.perf_counter()
+        data = np.memmap(path, dtype="<i8", mode="r")
+        serial = (sum_array(data), second_largest(data), max_difference(data))
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stats = parallel_stats(path, chunk_items=1 << 22)
+        parallel = (stats.total, stats.second_largest(), stats.max_difference())
+        parallel_time = time.perf_counter() - start
+
+        print(f"{n:,} int64 values ({n * 8 / 1e9:.1f} GB)")
+        print(f"serial:   {serial_time:.2f}s")
+        print(f"parallel: {parallel_time:.2f}s on {os.cpu_count()} cores")
+        print("same results:", serial == parallel)
+    finally:
+        os.remove(path)
@@ -0,0 +1,172 @@
+"""
+Single-pass statistics over a stream of numbers.
+
+sum_array (easy.py), second_largest (medium.py) and max_difference (hard.py)
+each walk the whole input on their own, so answering all three means three
+passes (or keeping everything in memory). StreamStats answers all of them,
+plus min, max and the k largest distinct values, from ONE pass, and two
+partial results can be merged. That means a file or generator far larger
+than memory can be read once, in chunks, and still be summarized exactly.
+
+Usage:
+    stats = summarize(read_numbers("numbers.txt"))
+    stats.total, stats.second_largest(), stats.max_difference()
+"""
+
+import heapq
+from numbers import Number
+from typing import Iterable, Iterator, List, Optional
+
+
+class StreamStats:
+    """
+    Running count, sum, min, max and top-k distinct values of a stream.
+
+    Time Complexity (Big-O):
+        update: O(1) for most values, O(log k) when the top-k changes.
+        merge:  O(k).
+    Space Complexity:
+        O(k) — nothing but the k largest distinct values is kept.
+    """
+
+    def __init__(self, k: int = 2):
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        self.k = k
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self._top = []        # min-heap of the k largest distinct values
+        self._top_set = set()  # same values, for O(1) "already kept?" checks
+
+    @classmethod
+    def from_parts(cls, count, total, minimum, maximum, top, k: int = 2) -> "StreamStats":
+        """Build a summary from values computed elsewhere (e.g. by NumPy in a worker)."""
+        stats = cls(k)
+        stats.count = count
+        stats.total = total
+        stats.minimum = minimum
+        stats.maximum = maximum
+        stats._top = heapq.nlargest(k, set(top))
+        heapq.heapify(stats._top)
+        stats._top_set = set(stats._top)
+        return stats
+
+    def update(self, x) -> None:
+        """Add one value to the summary."""
+        self.count += 1
+        self.total += x
+        if self.minimum is None or x < self.minimum:
+            self.minimum = x
+        if self.maximum is None or x > self.maximum:
+            self.maximum = x
+
+        # Keep the k largest distinct values; equal values are ignored
+        if x in self._top_set:
+            return
+        if len(self._top) < self.k:
+            heapq.heappush(self._top, x)
+            self._top_set.add(x)
+        elif x > self._top[0]:
+            dropped = heapq.heapreplace(self._top, x)
+            self._top_set.discard(dropped)
+            self._top_set.add(x)
+
+    def update_many(self, nums: Iterable) -> "StreamStats":
+        """Add every value from an iterable (one pass). Returns self."""
+        for x in nums:
+            self.update(x)
+        return self
+
+    def merge(self, other: "StreamStats") -> "StreamStats":
+        """
+        Return a new summary of both inputs, as if they had been one stream.
+
+        Raises:
+            ValueError if the two summaries keep a different number of top values.
+        """
+        if self.k != other.k:
+            raise ValueError("Cannot merge summaries with different k.")
+        merged = StreamStats(self.k)
+        merged.count = self.count + other.count
+        merged.total = self.total + other.total
+        mins = [m for m in (self.minimum, other.minimum) if m is not None]
+        maxs = [m for m in (self.maximum, other.maximum) if m is not None]
+        merged.minimum = min(mins) if mins else None
+        merged.maximum = max(maxs) if maxs else None
+        merged._top = heapq.nlargest(self.k, self._top_set | other._top_set)
+        heapq.heapify(merged._top)
+        merged._top_set = set(merged._top)
+        return merged
+
+    def top(self) -> List:
+        """The k largest distinct values, largest first."""
+        return sorted(self._top, reverse=True)
+
+    def second_largest(self) -> Optional[int]:
+        """Same answer as medium.second_largest: None if < 2 distinct values."""
+        if self.k < 2:
+            raise ValueError("second_largest needs a summary with k >= 2.")
+        top = self.top()
+        return top[1] if len(top) > 1 else None
+
+    def max_difference(self) -> int:
+        """
+        Same answer as hard.max_difference: max - min.
+
+        Raises:
+            ValueError if fewer than 2 values were seen.
+        """
+        if self.count < 2:
+            raise ValueError("Array must contain at least two numbers.")
+        return self.maximum - self.minimum
+
+
+def summarize(source: Iterable, k: int = 2) -> StreamStats:
+    """
+    Summarize a stream in one pass.
+
+    source may be a plain iterable of numbers, or an iterable of chunks
+    (lists, arrays, ...) such as read_numbers() produces. Each chunk is
+    summarized on its own and the partial results are merged.
+    """
+    result = StreamStats(k)
+    plain = StreamStats(k)
+    for item in source:
+        if isinstance(item, Number):
+            plain.update(item)
+        else:
+            result = result.merge(StreamStats(k).update_many(item))
+    return result.merge(plain)
+
+
+def read_numbers(path: str, chunk_size: int = 65536) -> Iterator[List[int]]:
+    """
+    Yield the whitespace-separated integers in a text file, chunk_size at a time.
+
+    Only one chunk is held in memory, so the file can be any size.
+    """
+    chunk = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            for token in line.split():
+                chunk.append(int(token))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+if __name__ == "__main__":
+    stats = summarize([7, 1, 5, 3, 6, 4, 7])
+    print(stats.total)             # 33
+    print(stats.second_largest())  # 6
+    print(stats.max_difference())  # 6
+
+    # Two halves summarized separately, then merged
+    left = StreamStats().update_many([5, 1, 7])
+    right = StreamStats().update_many([7, 3])
+    both = left.merge(right)
+    print(both.total, both.second_largest(), both.max_difference())  # 23 5 6
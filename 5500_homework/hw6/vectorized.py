@@ -0,0 +1,118 @@
+"""
+NumPy fast paths for the hw6 array functions.
+
+sum_array, second_largest and max_difference loop over their input one
+element at a time. When the input is already a block of numbers in memory
+(a NumPy array, an array.array or a memoryview — anything exposing the
+buffer protocol) the same answer can be computed by NumPy's compiled
+reductions, which is 50-100x faster.
+
+as_vector() decides whether an input can take the fast path. If NumPy is
+not installed, or the input is a list, generator, multi-dimensional, not
+numeric, or a float array containing NaN, it returns None and the caller
+keeps using its original loop, so results and errors never change.
+"""
+
+from array import array
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the plain loops still work
+    np = None
+
+# Floats are summed this many at a time so the temporary stays small
+_CHUNK = 1 << 20
+
+# The largest magnitude an int64 accumulator can hold
+_INT64_MAX = (1 << 63) - 1
+
+
+def as_vector(nums) -> Optional["np.ndarray"]:
+    """
+    Return nums as a 1-D numeric NumPy array without copying, or None if the
+    fast path does not apply and the caller should use its loop instead.
+    """
+    if np is None:
+        return None
+    if isinstance(nums, np.ndarray):
+        arr = nums
+    elif isinstance(nums, (array, memoryview)):
+        try:
+            arr = np.asarray(nums)
+        except (TypeError, ValueError):  # buffer format NumPy can't read
+            return None
+    else:
+        return None
+
+    if arr.ndim != 1 or arr.dtype.kind not in "iuf":
+        return None
+    # NaN makes comparisons order-dependent; leave that to the loop
+    if arr.dtype.kind == "f" and np.isnan(arr).any():
+        return None
+    return arr
+
+
+def _same_kind(value, nums):
+    # The loops return NumPy scalars for NumPy input and plain Python
+    # numbers for array.array / memoryview input; match that
+    return value if isinstance(nums, np.ndarray) else value.item()
+
+
+def vector_sum(arr: "np.ndarray", nums):
+    """
+    Same result as the sum_array loop.
+
+    Integers are summed exactly: np.sum in int64 when the result provably
+    fits, otherwise as Python ints, so large inputs never overflow.
+    Floats are accumulated left to right, exactly like the loop (np.sum
+    would use pairwise summation and could differ in the last bits). The
+    loop adds NumPy scalars in the array's dtype, but the Python floats an
+    array.array or memoryview yields in double precision.
+    """
+    if arr.size == 0:
+        return 0
+
+    if arr.dtype.kind in "iu":
+        low, high = int(arr.min()), int(arr.max())
+        if arr.size * max(abs(low), abs(high)) <= _INT64_MAX:
+            return int(arr.sum(dtype=np.int64))
+        return sum(arr.tolist())
+
+    # Running sum, chunk by chunk, carrying the total into the next chunk
+    dtype = arr.dtype if isinstance(nums, np.ndarray) else np.float64
+    total = None
+    for start in range(0, arr.size, _CHUNK):
+        chunk = arr[start:start + _CHUNK].astype(dtype)
+        if total is not None:
+            chunk[0] = total + chunk[0]
+        total = np.cumsum(chunk)[-1]
+    return _same_kind(total, nums)
+
+
+def vector_second_largest(arr: "np.ndarray", nums):
+    """Same result as the second_largest loop: the second largest distinct value or None."""
+    if arr.size == 0:
+        return None
+    largest = arr.max()
+    rest = arr[arr != largest]
+    if rest.size == 0:
+        return None
+    return _same_kind(rest.max(), nums)
+
+
+def vector_max_difference(arr: "np.ndarray", nums):
+    """
+    Same result as the max_difference loop.
+
+    Raises:
+        ValueError if fewer than 2 elements are provided.
+    """
+    if arr.size < 2:
+        raise ValueError("Array must contain at least two numbers.")
+    if arr.dtype.kind in "iu":
+        # Python ints, so e.g. int64 max - int64 min can't wrap around
+        return int(arr.max()) - int(arr.min())
+    if isinstance(nums, np.ndarray):
+        return arr.max() - arr.min()
+    return float(arr.max()) - float(arr.min())
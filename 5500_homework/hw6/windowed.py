@@ -0,0 +1,233 @@
+"""
+Sliding-window (online) versions of sum_array, max_difference and second_largest.
+
+The hw6 functions answer for a whole array. For a live metric stream we
+want the answer over the last `window` values, after every new value.
+Recomputing from scratch costs O(window) per update; these classes cost
+O(1) amortized per update:
+
+    WindowedSum            running total (add new value, subtract evicted one),
+                           kept exactly so float streams don't drift
+    WindowedMaxDifference  max - min using two monotonic deques
+    WindowedSecondLargest  second largest distinct value using a two-stack queue
+
+Each class has update(x), which adds x (evicting the oldest value once the
+window is full) and returns the current answer.
+
+Usage:
+    spread = WindowedMaxDifference(window=60)
+    for reading in stream:
+        print(spread.update(reading))
+"""
+
+import math
+from collections import deque
+from typing import Optional, Tuple
+
+
+class WindowedSum:
+    """
+    Sum of the last `window` values.
+
+    Algorithm:
+        A plain running float total loses the small values added next to a
+        big one, and the loss stays after the big value leaves the window
+        (window 2 over [1e16, 1.0, 1.0] would give 0.0 instead of 2.0).
+        Instead the total is kept exactly, as a short list of floats that
+        don't overlap in their bits (Shewchuk's partials, the method behind
+        math.fsum). Adding x, or adding -x to evict it, splits every sum
+        into its rounded value and the exact rounding error, so nothing is
+        lost; the answer is the correctly rounded sum of the partials.
+        Integer streams stay exact ints.
+
+    Time Complexity (Big-O):
+        O(p) per update, where p is the number of partials: usually 1-3,
+        never more than a few dozen for doubles.
+    Space Complexity:
+        O(window).
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+        self.window = window
+        self._values = deque()
+        self._partials = []  # exact sum of the window = sum of these
+
+    @property
+    def total(self):
+        """Sum of the current window."""
+        partials = self._partials
+        if not partials:
+            return 0
+        if len(partials) == 1:
+            return partials[0]
+        return math.fsum(partials)
+
+    def _add(self, x) -> None:
+        # Add x to the partials without rounding (Shewchuk / math.fsum)
+        kept = []
+        for y in self._partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)  # exactly what hi rounded away
+            if lo:
+                kept.append(lo)
+            x = hi
+        if x:
+            kept.append(x)
+        self._partials = kept
+
+    def update(self, x):
+        """Add x and return the sum of the current window."""
+        self._values.append(x)
+        self._add(x)
+        if len(self._values) > self.window:
+            self._add(-self._values.popleft())
+        return self.total
+
+
+class WindowedMaxDifference:
+    """
+    max - min of the last `window` values (hard.max_difference per window).
+
+    Algorithm:
+        Two monotonic deques of (index, value): one with decreasing values
+        (front = window max), one with increasing values (front = window
+        min). A new value pops every value it beats from the back, since
+        those can never be the max/min again; values older than the window
+        are popped from the front. Each value is pushed and popped at most
+        once per deque.
+
+    Time Complexity (Big-O):
+        O(1) amortized per update.
+    Space Complexity:
+        O(window).
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+        self.window = window
+        self._index = 0
+        self._maxq = deque()  # values decreasing front to back
+        self._minq = deque()  # values increasing front to back
+
+    def update(self, x) -> Optional[int]:
+        """Add x and return max - min of the window, or None until it holds 2 values."""
+        i = self._index
+        self._index += 1
+
+        while self._maxq and self._maxq[-1][1] <= x:
+            self._maxq.pop()
+        self._maxq.append((i, x))
+        while self._minq and self._minq[-1][1] >= x:
+            self._minq.pop()
+        self._minq.append((i, x))
+
+        # Drop values that slid out of the window
+        oldest = i - self.window + 1
+        if self._maxq[0][0] < oldest:
+            self._maxq.popleft()
+        if self._minq[0][0] < oldest:
+            self._minq.popleft()
+
+        # Same rule as max_difference: at least two values are needed
+        if min(self._index, self.window) < 2:
+            return None
+        return self._maxq[0][1] - self._minq[0][1]
+
+
+def _top2(a: Tuple, b: Tuple) -> Tuple:
+    """Merge two (largest, second largest distinct) pairs; missing values are None."""
+    values = {v for v in a + b if v is not None}
+    first = max(values) if values else None
+    values.discard(first)
+    second = max(values) if values else None
+    return first, second
+
+
+class WindowedSecondLargest:
+    """
+    Second largest distinct value of the last `window` values
+    (medium.second_largest per window).
+
+    Algorithm:
+        A monotonic deque keeps only values that could still become the
+        max, so it throws away the second largest whenever a larger value
+        arrives after it. Instead this uses a queue built from two stacks,
+        where every stack entry also stores the top-2 distinct values of
+        itself and everything beneath it. Pushing adds to the back stack;
+        evicting pops the front stack, refilling it from the back stack
+        (recomputing the top-2 on the way) only when it is empty. The
+        window answer is the top-2 of the two stack tops combined.
+
+    Time Complexity (Big-O):
+        O(1) amortized per update — each value moves between stacks once.
+    Space Complexity:
+        O(window).
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+        self.window = window
+        self._back = []   # (value, top2 of this and all older back entries)
+        self._front = []  # (value, top2 of this and all newer front entries)
+
+    def update(self, x) -> Optional[int]:
+        """Add x and return the second largest distinct value in the window (or None)."""
+        below = self._back[-1][1] if self._back else (None, None)
+        self._back.append((x, _top2(below, (x, None))))
+
+        if len(self._back) + len(self._front) > self.window:
+            if not self._front:
+                while self._back:
+                    value, _ = self._back.pop()
+                    below = self._front[-1][1] if self._front else (None, None)
+                    self._front.append((value, _top2(below, (value, None))))
+            self._front.pop()
+
+        front = self._front[-1][1] if self._front else (None, None)
+        back = self._back[-1][1] if self._back else (None, None)
+        return _top2(front, back)[1]
+
+
+if __name__ == "__main__":
+    import random
+    import timeit
+
+    from easy import sum_array
+    from hard import max_difference
+    from medium import second_largest
+
+    data = [7, 1, 5, 3, 6, 4, 7]
+    sums = WindowedSum(3)
+    spread = WindowedMaxDifference(3)
+    second = WindowedSecondLargest(3)
+    print([sums.update(x) for x in data])    # [7, 8, 13, 9, 14, 13, 17]
+    print([spread.update(x) for x in data])  # [None, 6, 6, 4, 3, 3, 3]
+    print([second.update(x) for x in data])  # [None, 1, 5, 3, 5, 4, 6]
+
+    # A large value leaving the window must not take the small ones with it
+    sums = WindowedSum(2)
+    print([sums.update(x) for x in [1e16, 1.0, 1.0, 1.0]])  # [1e16, 1e16, 2.0, 2.0]
+
+    # Compare against recomputing every window with the hw6 functions
+    n, window = 20_000, 1_000
+    stream = [random.randrange(10**6) for _ in range(n)]
+
+    def recompute():
+        for i in range(window, n + 1):
+            chunk = stream[i - window:i]
+            sum_array(chunk), max_difference(chunk), second_largest(chunk)
+
+    def online():
+        s, d, t = WindowedSum(window), WindowedMaxDifference(window), WindowedSecondLargest(window)
+        for x in stream:
+            s.update(x), d.update(x), t.update(x)
+
+    print(f"\n{n:,} updates, window {window:,}")
+    print(f"recompute each window: {timeit.timeit(recompute, number=1):.2f}s")
+    print(f"online update():       {timeit.timeit(online, number=1):.2f}s")
@@ -0,0 +1,262 @@
+# array_bst.py — Binary Search Tree stored in parallel arrays
+# The Node in easy.py / medium.py is a @dataclass, so every key costs a
+# whole Python object with its own __dict__ (well over 100 bytes), and the
+# nodes end up scattered around memory. This version keeps the tree in
+# three preallocated arrays instead:
+#
+#   keys[i]   the key stored in slot i
+#   left[i]   slot index of the left child  (NIL = -1 means no child)
+#   right[i]  slot index of the right child
+#
+# A "node" is just an integer slot index. The arrays double in size when
+# they fill up, and slots freed by delete() go on a free list (chained
+# through left[]) so they are reused by the next insert().
+#
+# The tree rules are the same as easy.py: smaller keys go left, greater or
+# equal keys go right, and nothing is rebalanced.
+
+from array import array
+from typing import Any, Iterable, Optional
+
+NIL = -1
+
+class ArrayBST:
+    __slots__ = ("keys", "left", "right", "root", "size", "_free", "_used")
+
+    def __init__(self, capacity: int = 16, typecode: Optional[str] = "q"):
+        # typecode is the array module type for the keys ("q" = 64-bit int,
+        # "d" = float). Pass None to keep keys in a plain list, which works
+        # for any comparable key (strings, tuples, ...).
+        capacity = max(1, capacity)
+        if typecode is None:
+            self.keys = [None] * capacity
+        else:
+            self.keys = array(typecode, [0]) * capacity
+        self.left = array("q", [NIL]) * capacity
+        self.right = array("q", [NIL]) * capacity
+        self.root = NIL     # slot of the root node
+        self.size = 0       # number of keys in the tree
+        self._free = NIL    # head of the free-slot list
+        self._used = 0      # slots handed out so far (high-water mark)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self) -> None:
+        # Double every array so appends stay amortized O(1)
+        extra = len(self.left)
+        if isinstance(self.keys, list):
+            self.keys.extend([None] * extra)
+        else:
+            self.keys.extend(array(self.keys.typecode, [0]) * extra)
+        self.left.extend(array("q", [NIL]) * extra)
+        self.right.extend(array("q", [NIL]) * extra)
+
+    def _new_slot(self, value: Any) -> int:
+        # Reuse a freed slot if there is one, otherwise take the next one.
+        # The key is stored before the slot is claimed, so a key the array
+        # can't hold (OverflowError/TypeError) leaves the tree unchanged.
+        if self._free != NIL:
+            slot = self._free
+            self.keys[slot] = value
+            self._free = self.left[slot]
+        else:
+            if self._used == len(self.left):
+                self._grow()
+            slot = self._used
+            self.keys[slot] = value
+            self._used += 1
+        self.left[slot] = NIL
+        self.right[slot] = NIL
+        return slot
+
+    def _release(self, slot: int) -> None:
+        # Push the slot onto the free list
+        self.left[slot] = self._free
+        self.right[slot] = NIL
+        if isinstance(self.keys, list):
+            self.keys[slot] = None  # drop the reference so it can be freed
+        self._free = slot
+
+    def insert(self, value: Any) -> None:
+        # Same rule as easy.py, but written as a loop instead of recursion.
+        # Find the parent first and claim a slot only when linking, so a
+        # failed comparison or a key the array can't hold changes nothing.
+        keys, left, right = self.keys, self.left, self.right
+        parent = NIL
+        go_left = False
+        current = self.root
+        while current != NIL:
+            parent = current
+            go_left = value < keys[current]
+            current = left[current] if go_left else right[current]
+
+        slot = self._new_slot(value)
+        if parent == NIL:
+            self.root = slot
+        elif go_left:
+            self.left[parent] = slot
+        else:
+            self.right[parent] = slot
+        self.size += 1
+
+    def search(self, value: Any) -> bool:
+        # Same loop as medium.py, following indices instead of pointers
+        keys, left, right = self.keys, self.left, self.right
+        current = self.root
+        while current != NIL:
+            key = keys[current]
+            if value == key:
+                return True
+            elif value < key:
+                current = left[current]
+            else:
+                current = right[current]
+        return False
+
+    def delete(self, value: Any) -> bool:
+        # Remove one copy of value using the cases from hard.py.
+        # Returns True if something was deleted.
+        keys, left, right = self.keys, self.left, self.right
+
+        # Find the node and its parent
+        parent = NIL
+        current = self.root
+        while current != NIL and value != keys[current]:
+            parent = current
+            current = left[current] if value < keys[current] else right[current]
+        if current == NIL:
+            return False
+
+        # Two children: copy the in-order successor's key here, then remove
+        # the successor (which has no left child) instead
+        if left[current] != NIL and right[current] != NIL:
+            parent = current
+            successor = right[current]
+            while left[successor] != NIL:
+                parent = successor
+                successor = left[successor]
+            keys[current] = keys[successor]
+            current = successor
+
+        # Zero or one child: link the parent straight to that child
+        child = left[current] if left[current] != NIL else right[current]
+        if parent == NIL:
+            self.root = child
+        elif left[parent] == current:
+            left[parent] = child
+        else:
+            right[parent] = child
+
+        self._release(current)
+        self.size -= 1
+        return True
+
+    def inorder(self) -> Iterable[Any]:
+        # Yield keys in sorted order using an explicit stack
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        current = self.root
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = left[current]
+            current = stack.pop()
+            yield keys[current]
+            current = right[current]
+
+# Example run for quick testing, plus a memory / speed comparison
+if __name__ == "__main__":
+    import random
+    import sys
+    import timeit
+    import tracemalloc
+    from dataclasses import dataclass
+
+    # Same tiny example as easy.py / medium.py
+    tree = ArrayBST()
+    for num in [5, 3, 7, 2, 4, 6, 8]:
+        tree.insert(num)
+    print(list(tree.inorder()))   # [2, 3, 4, 5, 6, 7, 8]
+    print(tree.search(4))         # True
+    print(tree.search(10))        # False
+    tree.delete(5)                # root with two children
+    print(list(tree.inorder()))   # [2, 3, 4, 6, 7, 8]
+
+    # ---------- Comparison against the dataclass version ----------
+    # The Node from easy.py / medium.py
+    @dataclass
+    class Node:
+        key: Any
+        left: Optional["Node"] = None
+        right: Optional["Node"] = None
+
+    # Same fields, but with __slots__ instead of a per-instance __dict__
+    class SlotNode:
+        __slots__ = ("key", "left", "right")
+
+        def __init__(self, key, left=None, right=None):
+            self.key = key
+            self.left = left
+            self.right = right
+
+    def build_nodes(node_cls, values):
+        # Iterative version of easy.py's insert so big inputs are fine
+        root = None
+        for value in values:
+            new = node_cls(value)
+            if root is None:
+                root = new
+                continue
+            current = root
+            while True:
+                if value < current.key:
+                    if current.left is None:
+                        current.left = new
+                        break
+                    current = current.left
+                else:
+                    if current.right is None:
+                        current.right = new
+                        break
+                    current = current.right
+        return root
+
+    def search_nodes(root, value):
+        # medium.py's search
+        current = root
+        while current is not None:
+            if value == current.key:
+                return True
+            elif value < current.key:
+                current = current.left
+            else:
+                current = current.right
+        return False
+
+    def build_array(values):
+        tree = ArrayBST(capacity=len(values))
+        for value in values:
+            tree.insert(value)
+        return tree
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    values = random.sample(range(n * 10), n)
+    probes = random.sample(range(n * 10), 100_000)
+
+    print(f"\n{n:,} random keys, {len(probes):,} searches")
+    print(f"{'layout':<16}{'bytes/key':>12}{'search (s)':>12}")
+    for label, build, find in [
+        ("dataclass Node", lambda: build_nodes(Node, values), search_nodes),
+        ("__slots__ Node", lambda: build_nodes(SlotNode, values), search_nodes),
+        ("ArrayBST", lambda: build_array(values), ArrayBST.search),
+    ]:
+        # Memory held by the built tree (the key ints themselves are shared
+        # with the "values" list, so they are not counted)
+        tracemalloc.start()
+        built = build()
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        seconds = timeit.timeit(lambda: [find(built, p) for p in probes], number=1)
+        print(f"{label:<16}{held / n:>12.1f}{seconds:>12.3f}")
@@ -0,0 +1,315 @@
+# balanced.py — Self-balancing (AVL) Binary Search Tree
+# This program keeps the same Node / insert / search style as easy.py and
+# medium.py, but rebalances the tree after every insert and delete so the
+# height always stays O(log n). Sorted input no longer turns the tree into
+# a linked list, and nothing is recursive, so millions of keys are fine.
+#
+# Duplicates: this tree stores each key once (like a set / ordered map).
+# Inserting a key that is already present leaves the tree unchanged.
+#
+# Every node also remembers the size of its subtree, which lets us answer
+# ordered questions (k-th smallest, floor, ceiling, ranges) in O(log n)
+# without copying the keys out into a list.
+
+from dataclasses import dataclass
+from typing import Optional, Any, List, Iterable, Iterator
+
+# Each Node represents one value in the tree
+@dataclass
+class Node:
+    key: Any
+    left: Optional["Node"] = None   # smaller values go here
+    right: Optional["Node"] = None  # larger values go here
+    height: int = 1                 # height of the subtree rooted here (leaf = 1)
+    size: int = 1                   # number of keys in the subtree rooted here
+
+def height(node: Optional[Node]) -> int:
+    # An empty subtree has height 0
+    return node.height if node is not None else 0
+
+def size(node: Optional[Node]) -> int:
+    # An empty subtree holds no keys
+    return node.size if node is not None else 0
+
+def _update(node: Node) -> None:
+    # Recompute the height and size from the two children
+    node.height = 1 + max(height(node.left), height(node.right))
+    node.size = 1 + size(node.left) + size(node.right)
+
+def _rotate_right(node: Node) -> Node:
+    #       node            pivot
+    #       /    \          /    \
+    #    pivot    c  ->    a     node
+    #    /   \                   /   \
+    #   a     b                 b     c
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+def _rotate_left(node: Node) -> Node:
+    # Mirror image of _rotate_right
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+def _rebalance(node: Node) -> Node:
+    # Fix the node if one side is more than 1 level taller than the other,
+    # and return the (possibly new) root of this subtree
+    _update(node)
+    balance = height(node.left) - height(node.right)
+
+    # Left side too tall
+    if balance > 1:
+        # Left-Right case: rotate the child first
+        if height(node.left.left) < height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+
+    # Right side too tall
+    if balance < -1:
+        # Right-Left case: rotate the child first
+        if height(node.right.right) < height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+
+    return node
+
+def _retrace(path: List[Node]) -> Node:
+    # Walk back up the path from the deepest node to the root, rebalancing
+    # each node and re-linking the (possibly rotated) subtree to its parent.
+    # Returns the new root of the whole tree.
+    for i in range(len(path) - 1, 0, -1):
+        node = path[i]
+        fixed = _rebalance(node)
+        parent = path[i - 1]
+        if parent.left is node:
+            parent.left = fixed
+        else:
+            parent.right = fixed
+    return _rebalance(path[0])
+
+def insert(root: Optional[Node], value: Any) -> Node:
+    # If the tree is empty, create a new node and return it as the root
+    if root is None:
+        return Node(value)
+
+    # Walk down to the spot where the value belongs, remembering the path
+    path = []
+    current = root
+    while current is not None:
+        # Value already in the tree: nothing to do
+        if value == current.key:
+            return root
+        path.append(current)
+        if value < current.key:
+            current = current.left
+        else:
+            current = current.right
+
+    # Attach the new leaf to the last node on the path
+    parent = path[-1]
+    if value < parent.key:
+        parent.left = Node(value)
+    else:
+        parent.right = Node(value)
+
+    # Rebalance from the bottom up and return the new root
+    return _retrace(path)
+
+def search(root: Optional[Node], value: Any) -> bool:
+    # Same loop as medium.py — the tree is balanced, so this is O(log n)
+    current = root
+    while current is not None:
+        if value == current.key:
+            return True
+        elif value < current.key:
+            current = current.left
+        else:
+            current = current.right
+    return False
+
+def delete(root: Optional[Node], value: Any) -> Optional[Node]:
+    # Follows the three cases described in hard.py, then rebalances.
+    # Returns the new root (which may change, or become None).
+
+    # Empty tree: nothing to delete
+    if root is None:
+        return None
+
+    # Find the node, remembering the path from the root
+    path = []
+    current = root
+    while current is not None and value != current.key:
+        path.append(current)
+        if value < current.key:
+            current = current.left
+        else:
+            current = current.right
+
+    # Value not in the tree: unchanged
+    if current is None:
+        return root
+
+    # Case 3: two children — copy the in-order successor (smallest value in
+    # the right subtree) into this node, then delete the successor instead.
+    # The successor has no left child, so it falls into case 1 or 2.
+    if current.left is not None and current.right is not None:
+        path.append(current)
+        successor = current.right
+        while successor.left is not None:
+            path.append(successor)
+            successor = successor.left
+        current.key = successor.key
+        current = successor
+
+    # Cases 1 and 2: no children or one child — replace the node with its
+    # only child (or None for a leaf)
+    replacement = current.left if current.left is not None else current.right
+
+    # Deleting the root itself
+    if not path:
+        return replacement
+
+    parent = path[-1]
+    if parent.left is current:
+        parent.left = replacement
+    else:
+        parent.right = replacement
+
+    # Rebalance from the parent back up to the root
+    return _retrace(path)
+
+def build_from_sorted(values: Iterable[Any]) -> Optional[Node]:
+    # Build a perfectly balanced tree from already-sorted values in O(n):
+    # the middle value becomes the root, and each half is built the same
+    # way. Repeated values are kept once. Raises ValueError if the input
+    # is not sorted.
+    keys = []
+    for value in values:
+        if keys:
+            if value < keys[-1]:
+                raise ValueError("build_from_sorted() needs sorted input.")
+            if value == keys[-1]:
+                continue
+        keys.append(value)
+
+    def build(lo: int, hi: int) -> Optional[Node]:
+        # Recursion depth is only log2(n), so this is safe for huge inputs
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = Node(keys[mid], build(lo, mid), build(mid + 1, hi))
+        _update(node)
+        return node
+
+    return build(0, len(keys))
+
+def inorder(root: Optional[Node]) -> Iterator[Any]:
+    # Lazily yield every key in sorted order (explicit stack, no recursion)
+    stack = []
+    current = root
+    while stack or current is not None:
+        while current is not None:
+            stack.append(current)
+            current = current.left
+        current = stack.pop()
+        yield current.key
+        current = current.right
+
+def range_query(root: Optional[Node], lo: Any, hi: Any) -> Iterator[Any]:
+    # Lazily yield the keys k with lo <= k < hi in sorted order.
+    # Only the O(log n) nodes along the edges of the range are visited
+    # besides the ones that are yielded.
+    stack = []
+    current = root
+    while stack or current is not None:
+        # Go left, but skip subtrees that are entirely below lo
+        while current is not None:
+            if current.key < lo:
+                current = current.right
+            else:
+                stack.append(current)
+                current = current.left
+        # Everything left is below lo
+        if not stack:
+            return
+        current = stack.pop()
+        if not current.key < hi:
+            return
+        yield current.key
+        current = current.right
+
+def floor(root: Optional[Node], value: Any) -> Optional[Any]:
+    # Largest key <= value, or None if there is none
+    best = None
+    current = root
+    while current is not None:
+        if value == current.key:
+            return current.key
+        elif value < current.key:
+            current = current.left
+        else:
+            best = current.key
+            current = current.right
+    return best
+
+def ceiling(root: Optional[Node], value: Any) -> Optional[Any]:
+    # Smallest key >= value, or None if there is none
+    best = None
+    current = root
+    while current is not None:
+        if value == current.key:
+            return current.key
+        elif value < current.key:
+            best = current.key
+            current = current.left
+        else:
+            current = current.right
+    return best
+
+def kth_smallest(root: Optional[Node], k: int) -> Any:
+    # The k-th smallest key (k = 0 is the minimum), found with the subtree
+    # sizes in O(log n). Raises IndexError if k is out of range.
+    if not 0 <= k < size(root):
+        raise IndexError("k is out of range.")
+    current = root
+    while True:
+        left_size = size(current.left)
+        if k < left_size:
+            current = current.left
+        elif k == left_size:
+            return current.key
+        else:
+            k -= left_size + 1
+            current = current.right
+
+# Example run for quick testing
+if __name__ == "__main__":
+    # Sorted input would make easy.py's tree a linked list (and hit the
+    # recursion limit); here it stays balanced
+    tree = None
+    for num in range(1, 100001):
+        tree = insert(tree, num)
+
+    print(height(tree))             # 17 — about log2(100000)
+    print(search(tree, 4))          # True
+    print(search(tree, 100001))     # False
+
+    # Delete a leaf, a node with one child and a node with two children
+    for num in [1, 2, 50000]:
+        tree = delete(tree, num)
+    print(search(tree, 50000))      # False
+    print(height(tree))             # still 17
+
+    # Bulk load in O(n) and ask ordered questions without building lists
+    tree = build_from_sorted(range(0, 1000, 10))
+    print(list(range_query(tree, 95, 140)))  # [100, 110, 120, 130]
+    print(floor(tree, 95), ceiling(tree, 95))  # 90 100
+    print(kth_smallest(tree, 3))             # 30
+    print(next(inorder(tree)))               # 0
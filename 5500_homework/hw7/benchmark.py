@@ -0,0 +1,288 @@
+# benchmark.py — Timing the hw7 trees on different kinds of input
+# hard.py warns that an unbalanced tree can be slow ("up to O(n) time"),
+# but never measures it. This script builds each tree from random,
+# sorted, reverse-sorted and duplicate-heavy input and reports, for every
+# size:
+#
+#   height      how deep the tree got (a list/set has no height: "-")
+#   insert/s    inserts per second while building
+#   search/s    searches per second (half hits, half misses)
+#   delete/s    deletes per second (half of the keys, random order)
+#   peak MB     peak memory while building (tracemalloc, separate run)
+#
+# Structures compared:
+#   naive BST   easy.py insert + medium.py search (recursive, no delete)
+#   ArrayBST    array_bst.py (unbalanced, iterative, has delete)
+#   AVL         balanced.py (self-balancing)
+#   bisect      a sorted Python list with the bisect module (insort/del
+#               shift the list, so building or deleting is O(n^2))
+#   set / dict  Python's built-in hash tables (no ordering)
+#
+# Usage:
+#   python benchmark.py                          # 10^3 .. 10^5 keys
+#   python benchmark.py --sizes 1000 10000000    # up to 10^7 keys
+#   python benchmark.py --dist sorted --naive-limit 20000
+#
+# Unbalanced trees need O(n^2) time on sorted input, so they are skipped
+# above --naive-limit keys for the sorted, reverse and duplicate inputs.
+# The bisect list is O(n^2) on every input, so it is skipped above
+# --bisect-limit keys.
+# The naive BST is recursive, so it stops with "recursion limit" when the
+# tree gets deeper than Python allows.
+
+import argparse
+import bisect
+import random
+import sys
+import time
+import tracemalloc
+
+import easy
+import medium
+import balanced
+from array_bst import ArrayBST, NIL
+
+DISTRIBUTIONS = ["random", "sorted", "reverse", "dups"]
+
+def make_keys(dist, n, rng):
+    # Build the input keys for one distribution
+    if dist == "random":
+        return rng.sample(range(n * 10), n)
+    if dist == "sorted":
+        return list(range(n))
+    if dist == "reverse":
+        return list(range(n, 0, -1))
+    if dist == "dups":
+        # Only about 1% distinct values, in random order
+        return [rng.randrange(max(1, n // 100)) for _ in range(n)]
+    raise ValueError(f"Unknown distribution: {dist}")
+
+def make_misses(dist, keys, count, rng):
+    # Probe values that are not keys but fall between keys, so a search
+    # for them walks as deep into the tree as a search for a real key.
+    # (Values below every key would stop at the root of a sorted-input
+    # chain and walk the whole chain of a reverse-input one.)
+    if dist == "random":
+        # Unused values from the same range the keys came from
+        used = set(keys)
+        misses = []
+        while len(misses) < count:
+            value = rng.randrange(len(keys) * 10)
+            if value not in used:
+                misses.append(value)
+        return misses
+    # Integer keys: halfway between a key and the next integer
+    return [key + 0.5 for key in rng.choices(keys, k=count)]
+
+# ---------- Tree heights (all iterative) ----------
+def node_height(root):
+    # Height of a tree made of easy.py Nodes
+    best = 0
+    stack = [(root, 1)] if root is not None else []
+    while stack:
+        node, depth = stack.pop()
+        best = max(best, depth)
+        for child in (node.left, node.right):
+            if child is not None:
+                stack.append((child, depth + 1))
+    return best
+
+def array_height(tree):
+    # Height of an ArrayBST
+    best = 0
+    stack = [(tree.root, 1)] if tree.root != NIL else []
+    while stack:
+        slot, depth = stack.pop()
+        best = max(best, depth)
+        for child in (tree.left[slot], tree.right[slot]):
+            if child != NIL:
+                stack.append((child, depth + 1))
+    return best
+
+# ---------- One adapter per structure ----------
+# Each adapter has build(keys), search(tree, probes), delete(tree, keys)
+# and height(tree). delete and height may be None when not supported.
+
+def naive_build(keys):
+    tree = None
+    for key in keys:
+        tree = easy.insert(tree, key)
+    return tree
+
+def naive_search(tree, probes):
+    for probe in probes:
+        medium.search(tree, probe)
+
+def array_build(keys):
+    tree = ArrayBST(capacity=len(keys))
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+def array_search(tree, probes):
+    for probe in probes:
+        tree.search(probe)
+
+def array_delete(tree, keys):
+    for key in keys:
+        tree.delete(key)
+
+def avl_build(keys):
+    tree = None
+    for key in keys:
+        tree = balanced.insert(tree, key)
+    return tree
+
+def avl_search(tree, probes):
+    for probe in probes:
+        balanced.search(tree, probe)
+
+def avl_delete(tree, keys):
+    for key in keys:
+        tree = balanced.delete(tree, key)
+
+def bisect_build(keys):
+    items = []
+    for key in keys:
+        bisect.insort(items, key)
+    return items
+
+def bisect_search(items, probes):
+    for probe in probes:
+        i = bisect.bisect_left(items, probe)
+        i < len(items) and items[i] == probe
+
+def bisect_delete(items, keys):
+    for key in keys:
+        i = bisect.bisect_left(items, key)
+        if i < len(items) and items[i] == key:
+            del items[i]
+
+def set_build(keys):
+    items = set()
+    for key in keys:
+        items.add(key)
+    return items
+
+def hash_search(items, probes):
+    for probe in probes:
+        probe in items
+
+def set_delete(items, keys):
+    for key in keys:
+        items.discard(key)
+
+def dict_build(keys):
+    items = {}
+    for key in keys:
+        items[key] = True
+    return items
+
+def dict_delete(items, keys):
+    for key in keys:
+        items.pop(key, None)
+
+# Worst-case cost, used to skip runs that would take hours:
+#   "unbalanced"  O(n^2) on sorted / reverse / duplicate input
+#   "quadratic"   O(n^2) on every input
+STRUCTURES = [
+    # name, build, search, delete, height, cost
+    ("naive BST", naive_build, naive_search, None, node_height, "unbalanced"),
+    ("ArrayBST", array_build, array_search, array_delete, array_height, "unbalanced"),
+    ("AVL", avl_build, avl_search, avl_delete, balanced.height, None),
+    ("bisect", bisect_build, bisect_search, bisect_delete, None, "quadratic"),
+    ("set", set_build, hash_search, set_delete, None, None),
+    ("dict", dict_build, hash_search, dict_delete, None, None),
+]
+
+def rate(count, seconds):
+    # Operations per second, formatted compactly
+    if seconds <= 0:
+        return "inf"
+    per_sec = count / seconds
+    if per_sec >= 1e6:
+        return f"{per_sec / 1e6:.2f}M"
+    return f"{per_sec / 1e3:.1f}k"
+
+def run_one(structure, keys, probes, doomed):
+    # Time one structure on one input. Returns the printed row values.
+    name, build, search, delete, height, _ = structure
+
+    try:
+        start = time.perf_counter()
+        tree = build(keys)
+        insert_time = time.perf_counter() - start
+    except RecursionError:
+        return [name, "recursion limit", "", "", "", ""]
+
+    tree_height = str(height(tree)) if height is not None else "-"
+
+    start = time.perf_counter()
+    search(tree, probes)
+    search_time = time.perf_counter() - start
+
+    if delete is not None:
+        start = time.perf_counter()
+        delete(tree, doomed)
+        delete_text = rate(len(doomed), time.perf_counter() - start)
+    else:
+        delete_text = "-"
+
+    # Peak memory is measured on a separate build, because tracemalloc
+    # slows everything down and would distort the timings above
+    del tree
+    tracemalloc.start()
+    tree = build(keys)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+
+    return [
+        name,
+        tree_height,
+        rate(len(keys), insert_time),
+        rate(len(probes), search_time),
+        delete_text,
+        f"{peak / 1e6:.1f}",
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the hw7 trees.")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000],
+                        help="number of keys to insert (default: 10^3 10^4 10^5)")
+    parser.add_argument("--dist", choices=DISTRIBUTIONS, nargs="+",
+                        default=DISTRIBUTIONS, help="input distributions")
+    parser.add_argument("--naive-limit", type=int, default=5_000,
+                        help="largest size for unbalanced trees on non-random input")
+    parser.add_argument("--bisect-limit", type=int, default=100_000,
+                        help="largest size for the bisect list (O(n^2) on any input)")
+    parser.add_argument("--seed", type=int, default=5500)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    header = ["structure", "height", "insert/s", "search/s", "delete/s", "peak MB"]
+    widths = [12, 16, 10, 10, 10, 9]
+
+    for dist in args.dist:
+        for n in args.sizes:
+            keys = make_keys(dist, n, rng)
+            # Half of the probes are keys in the tree, half are not
+            probes = rng.sample(keys, n // 2) + make_misses(dist, keys, n - n // 2, rng)
+            rng.shuffle(probes)
+            doomed = rng.sample(keys, n // 2)
+
+            print(f"\n{dist} input, {n:,} keys")
+            print("".join(h.ljust(w) for h, w in zip(header, widths)))
+            for structure in STRUCTURES:
+                cost = structure[5]
+                if (cost == "unbalanced" and dist != "random" and n > args.naive_limit
+                        or cost == "quadratic" and n > args.bisect_limit):
+                    row = [structure[0], "skipped (O(n^2))", "", "", "", ""]
+                else:
+                    row = run_one(structure, keys, probes, doomed)
+                print("".join(str(v).ljust(w) for v, w in zip(row, widths)))
+                sys.stdout.flush()
+
+if __name__ == "__main__":
+    main()
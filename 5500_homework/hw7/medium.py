@@ -2,8 +2,9 @@
 # This program defines a function that checks if a value
 # exists in the BST and returns True or False.
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Optional, Any
+from typing import Optional, Any, Iterable, List
 
 # Node class is the same as before
 @dataclass
@@ -31,6 +32,38 @@ def search(root: Optional[Node], value: Any) -> bool:
     # If we run out of nodes, the value was not found
     return False
 
+def search_many(root: Optional[Node], values: Iterable[Any]) -> List[bool]:
+    # Check a whole batch of values in one walk of the tree.
+    # Returns a list of True/False in the same order as values.
+    #
+    # Instead of starting at the root once per value, we sort the distinct
+    # values and send them down the tree together: at each node the sorted
+    # batch is split (with a binary search) into the part that belongs on
+    # the left and the part that belongs on the right. Every node is visited
+    # at most once, and only if some value still needs it, so shared path
+    # prefixes near the root are walked once instead of once per value.
+    values = list(values)
+    probes = sorted(set(values))
+    found = set()
+
+    # Each stack entry is a subtree plus the slice probes[lo:hi] that
+    # still has to be looked up inside it
+    stack = [(root, 0, len(probes))]
+    while stack:
+        node, lo, hi = stack.pop()
+        if node is None or lo >= hi:
+            continue
+        # Split the slice around this node's key
+        mid = bisect_left(probes, node.key, lo, hi)
+        if mid < hi and probes[mid] == node.key:
+            found.add(node.key)
+            stack.append((node.right, mid + 1, hi))
+        else:
+            stack.append((node.right, mid, hi))
+        stack.append((node.left, lo, mid))
+
+    return [value in found for value in values]
+
 # Example run for quick testing
 if __name__ == "__main__":
     # Simple helper to insert nodes (same as easy.py)
@@ -51,3 +84,22 @@ if __name__ == "__main__":
     # Try searching for a value that exists and one that doesn't
     print(search(tree, 4))  # Should print True
     print(search(tree, 10)) # Should print False
+
+    # Look up a batch of values at once
+    print(search_many(tree, [4, 10, 2, 4]))  # [True, False, True, True]
+
+    # Timing against a loop of search() calls: python medium.py --bench
+    import sys
+    if "--bench" in sys.argv:
+        import random
+        import timeit
+
+        n, m = 100_000, 1_000_000
+        big = None
+        for num in random.sample(range(n * 10), n):
+            big = insert(big, num)
+        probes = [random.randrange(n * 10) for _ in range(m)]
+
+        loop = timeit.timeit(lambda: [search(big, p) for p in probes], number=1)
+        batch = timeit.timeit(lambda: search_many(big, probes), number=1)
+        print(f"{m:,} probes on {n:,} keys: loop {loop:.2f}s, search_many {batch:.2f}s")
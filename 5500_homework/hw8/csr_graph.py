@@ -0,0 +1,217 @@
+"""Compressed sparse row (CSR) graph, a compact stand-in for nx.Graph / nx.DiGraph.
+
+NetworkX keeps a dict of dicts per node, which is flexible but large and
+slow to walk. CSRGraph stores the same adjacency in three flat NumPy arrays:
+
+    indptr[i]:indptr[i+1]   the slice of `indices`/`weights` for node i
+    indices                 neighbor (successor) ids, sorted within each row
+    weights                 edge weight, NaN where the edge has no weight
+
+Degrees are precomputed, so degree queries are O(1), and neighbors of a
+node sit next to each other in memory. The graph is read-only.
+
+It answers the calls the hw8 and hw9 helpers make on a NetworkX graph
+(number_of_nodes, degree, has_edge, graph[u][v].get("weight")), so
+count_nodes, count_high_degree_nodes and compute_path_weight accept it
+unchanged.
+"""
+
+from typing import Hashable, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+class _EdgeData:
+    """Read-only view of graph[u]: maps each neighbor v to its edge data dict."""
+
+    __slots__ = ("_graph", "_row")
+
+    def __init__(self, graph: "CSRGraph", row: int):
+        self._graph = graph
+        self._row = row
+
+    def __getitem__(self, v: Hashable) -> dict:
+        pos = self._graph._find(self._row, v)
+        if pos is None:
+            raise KeyError(v)
+        weight = self._graph.weights[pos]
+        return {} if np.isnan(weight) else {"weight": float(weight)}
+
+    def __contains__(self, v: Hashable) -> bool:
+        return self._graph._find(self._row, v) is not None
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return self._graph._row_neighbors(self._row)
+
+    def __len__(self) -> int:
+        return int(self._graph.indptr[self._row + 1] - self._graph.indptr[self._row])
+
+
+class CSRGraph:
+    """Graph stored as CSR arrays. Build it with from_edges() or from_networkx()."""
+
+    def __init__(self, nodes: List[Hashable], indptr: np.ndarray, indices: np.ndarray,
+                 weights: np.ndarray, directed: bool):
+        self.nodes = nodes                                   # id -> label
+        self.index = {node: i for i, node in enumerate(nodes)}  # label -> id
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.directed = directed
+
+        out_degree = np.diff(indptr)
+        if directed:
+            # nx.DiGraph degree = in-degree + out-degree
+            self.degrees = out_degree + np.bincount(indices, minlength=len(nodes))
+        else:
+            # nx.Graph counts a self-loop twice, but it is stored once in its row
+            rows = np.repeat(np.arange(len(nodes)), out_degree)
+            loops = np.bincount(rows[rows == indices], minlength=len(nodes))
+            self.degrees = out_degree + loops
+
+    # ---------- Construction ----------
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple], directed: bool = False,
+                   nodes: Optional[Iterable[Hashable]] = None) -> "CSRGraph":
+        """Build from (u, v) or (u, v, weight) tuples.
+
+        Node ids follow first appearance (after `nodes`, if given), like
+        NetworkX. A repeated edge keeps its last weight, like add_edge.
+        """
+        index = {}
+        for node in nodes or ():
+            index.setdefault(node, len(index))
+        src, dst, wts = [], [], []
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            src.append(index.setdefault(u, len(index)))
+            dst.append(index.setdefault(v, len(index)))
+            wts.append(edge[2] if len(edge) > 2 and edge[2] is not None else np.nan)
+
+        src = np.array(src, dtype=np.int64)
+        dst = np.array(dst, dtype=np.int64)
+        wts = np.array(wts, dtype=np.float64)
+        order = np.arange(len(src))
+        if not directed:
+            # Store both directions (a self-loop only once)
+            back = src != dst
+            src, dst = np.concatenate([src, dst[back]]), np.concatenate([dst, src[back]])
+            wts = np.concatenate([wts, wts[back]])
+            order = np.concatenate([order, order[back]])
+
+        # Sort by (row, neighbor, input position) and keep the last copy of
+        # each edge so a repeated edge behaves like a second add_edge call
+        perm = np.lexsort((order, dst, src))
+        src, dst, wts = src[perm], dst[perm], wts[perm]
+        last = np.ones(len(src), dtype=bool)
+        last[:-1] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+        src, dst, wts = src[last], dst[last], wts[last]
+
+        indptr = np.zeros(len(index) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=len(index)), out=indptr[1:])
+        return cls(list(index), indptr, dst, wts, directed)
+
+    @classmethod
+    def from_networkx(cls, graph, weight: str = "weight") -> "CSRGraph":
+        """Convert an nx.Graph or nx.DiGraph (isolated nodes included)."""
+        edges = graph.edges(data=weight, default=None)
+        return cls.from_edges(edges, directed=graph.is_directed(), nodes=list(graph))
+
+    def to_networkx(self):
+        """Convert back to an nx.Graph / nx.DiGraph."""
+        import networkx as nx
+
+        graph = nx.DiGraph() if self.directed else nx.Graph()
+        graph.add_nodes_from(self.nodes)
+        for u in range(len(self.nodes)):
+            for pos in range(self.indptr[u], self.indptr[u + 1]):
+                v, w = self.nodes[self.indices[pos]], self.weights[pos]
+                if np.isnan(w):
+                    graph.add_edge(self.nodes[u], v)
+                else:
+                    graph.add_edge(self.nodes[u], v, weight=float(w))
+        return graph
+
+    # ---------- Internal lookups ----------
+    def _find(self, row: int, v: Hashable) -> Optional[int]:
+        """Position of edge row -> v in indices/weights, or None (binary search)."""
+        col = self.index.get(v)
+        if col is None:
+            return None
+        start, end = self.indptr[row], self.indptr[row + 1]
+        pos = start + int(np.searchsorted(self.indices[start:end], col))
+        if pos < end and self.indices[pos] == col:
+            return pos
+        return None
+
+    def _row_neighbors(self, row: int) -> Iterator[Hashable]:
+        nodes = self.nodes
+        for col in self.indices[self.indptr[row]:self.indptr[row + 1]].tolist():
+            yield nodes[col]
+
+    # ---------- NetworkX-style queries ----------
+    def is_directed(self) -> bool:
+        return self.directed
+
+    def number_of_nodes(self) -> int:
+        return len(self.nodes)
+
+    def number_of_edges(self) -> int:
+        if self.directed:
+            return len(self.indices)
+        loops = int(np.sum(self.degrees) - len(self.indices))
+        return (len(self.indices) + loops) // 2
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.nodes)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self.index
+
+    def __getitem__(self, u: Hashable) -> _EdgeData:
+        return _EdgeData(self, self.index[u])
+
+    def degree(self, node: Hashable = None):
+        """Degree of one node, or (node, degree) pairs for all nodes like G.degree()."""
+        if node is not None:
+            return int(self.degrees[self.index[node]])
+        return zip(self.nodes, self.degrees.tolist())
+
+    def neighbors(self, u: Hashable) -> Iterator[Hashable]:
+        """Neighbors (successors, if directed) of u."""
+        return self._row_neighbors(self.index[u])
+
+    successors = neighbors
+
+    def has_edge(self, u: Hashable, v: Hashable) -> bool:
+        row = self.index.get(u)
+        return row is not None and self._find(row, v) is not None
+
+    def edge_weight(self, u: Hashable, v: Hashable, default=None):
+        """Weight of edge u -> v, or default if the edge or its weight is missing."""
+        row = self.index.get(u)
+        pos = None if row is None else self._find(row, v)
+        if pos is None or np.isnan(self.weights[pos]):
+            return default
+        return float(self.weights[pos])
+
+
+# Example test
+if __name__ == "__main__":
+    import networkx as nx
+
+    G = nx.Graph()
+    G.add_edges_from([
+        (1, 2), (1, 3), (1, 4), (1, 5),
+        (1, 6), (1, 7), (2, 3), (3, 4)
+    ])
+    C = CSRGraph.from_networkx(G)
+    print("Number of nodes:", C.number_of_nodes())
+    print("Degree of node 1:", C.degree(1))
+    print("Neighbors of 3:", list(C.neighbors(3)))
+
+    D = CSRGraph.from_edges([("btc", "eth", 30.0), ("eth", "btc", 0.033)], directed=True)
+    print("btc -> eth weight:", D["btc"]["eth"].get("weight"))
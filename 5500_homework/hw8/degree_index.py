@@ -0,0 +1,186 @@
+"""Degree index that keeps "how many nodes have degree > k?" up to date as edges change.
+
+count_high_degree_nodes (hard.py) looks at every node's degree on every
+call. IndexedGraph is an nx.Graph that also keeps a DegreeIndex: a Fenwick
+(binary indexed) tree over "number of nodes with degree d". Each node or
+edge added or removed moves a few nodes between degree buckets in
+O(log maxdeg), and the count of nodes above any threshold is a prefix sum,
+also O(log maxdeg).
+
+Only changes made through the Graph methods (add_edge, remove_node, ...) are
+tracked; editing G.adj / G._adj directly bypasses the index. Views
+(G.subgraph, G.edge_subgraph, G.to_undirected(as_view=True)) are frozen
+IndexedGraphs whose index is empty, so they count degrees the usual way.
+"""
+
+from typing import Dict, Hashable, Iterable, Optional
+
+import networkx as nx
+
+
+class DegreeIndex:
+    """Fenwick tree over the degree histogram."""
+
+    def __init__(self, capacity: int = 64):
+        self._counts = [0] * capacity   # nodes per degree (plain histogram)
+        self._tree = [0] * (capacity + 1)  # Fenwick tree over _counts
+        self.total = 0                   # number of nodes
+
+    def _add(self, degree: int, delta: int) -> None:
+        if degree >= len(self._counts):
+            self._grow(degree + 1)
+        self._counts[degree] += delta
+        i = degree + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _grow(self, needed: int) -> None:
+        # Double the capacity and rebuild the tree in O(capacity)
+        capacity = max(needed, 2 * len(self._counts))
+        self._counts.extend([0] * (capacity - len(self._counts)))
+        tree = [0] * (capacity + 1)
+        for i, count in enumerate(self._counts, start=1):
+            tree[i] += count
+            parent = i + (i & -i)
+            if parent <= capacity:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def move(self, old: Optional[int], new: Optional[int]) -> None:
+        """A node's degree changed from old to new (None = node absent)."""
+        if old == new:
+            return
+        if old is not None:
+            self._add(old, -1)
+            self.total -= 1
+        if new is not None:
+            self._add(new, 1)
+            self.total += 1
+
+    def count_at_most(self, k: int) -> int:
+        """Number of nodes with degree <= k."""
+        if k < 0:
+            return 0
+        i = min(k + 1, len(self._counts))
+        result = 0
+        while i > 0:
+            result += self._tree[i]
+            i -= i & -i
+        return result
+
+    def count_greater(self, k: int) -> int:
+        """Number of nodes with degree > k."""
+        return self.total - self.count_at_most(k)
+
+    def histogram(self):
+        """Same as nx.degree_histogram(G)."""
+        last = max((d for d, c in enumerate(self._counts) if c), default=-1)
+        return self._counts[:last + 1]
+
+
+class IndexedGraph(nx.Graph):
+    """An nx.Graph that keeps a DegreeIndex (self.degree_index) in sync with its edges."""
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self.degree_index = DegreeIndex()
+        super().__init__(incoming_graph_data, **attr)
+
+    # ---------- Bookkeeping ----------
+    def _degree_or_none(self, node: Hashable) -> Optional[int]:
+        # Same as G.degree[node] (a self-loop counts twice), None if absent
+        if node not in self._adj:
+            return None
+        neighbors = self._adj[node]
+        return len(neighbors) + (node in neighbors)
+
+    def _snapshot(self, nodes: Iterable[Hashable]) -> Dict[Hashable, Optional[int]]:
+        return {node: self._degree_or_none(node) for node in nodes}
+
+    def _reconcile(self, before: Dict[Hashable, Optional[int]]) -> None:
+        for node, old in before.items():
+            self.degree_index.move(old, self._degree_or_none(node))
+
+    # ---------- Nodes ----------
+    def add_node(self, node_for_adding, **attr):
+        before = self._snapshot([node_for_adding])
+        super().add_node(node_for_adding, **attr)
+        self._reconcile(before)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        for item in nodes_for_adding:
+            # Items may be plain nodes or (node, attr_dict) pairs
+            is_pair = isinstance(item, tuple) and len(item) == 2 and isinstance(item[1], dict)
+            node = item[0] if is_pair else item
+            before = self._snapshot([node])
+            super().add_nodes_from([item], **attr)
+            self._reconcile(before)
+
+    def remove_node(self, n):
+        before = self._snapshot([n, *self._adj.get(n, ())])
+        super().remove_node(n)
+        self._reconcile(before)
+
+    def remove_nodes_from(self, nodes):
+        for n in list(nodes):
+            if n in self._adj:
+                self.remove_node(n)
+
+    # ---------- Edges ----------
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        before = self._snapshot([u_of_edge, v_of_edge])
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+        self._reconcile(before)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        for edge in ebunch_to_add:
+            before = self._snapshot(edge[:2])
+            super().add_edges_from([edge], **attr)
+            self._reconcile(before)
+
+    def remove_edge(self, u, v):
+        before = self._snapshot([u, v])
+        super().remove_edge(u, v)
+        self._reconcile(before)
+
+    def remove_edges_from(self, ebunch):
+        for edge in ebunch:
+            before = self._snapshot(edge[:2])
+            super().remove_edges_from([edge])
+            self._reconcile(before)
+
+    def clear(self):
+        super().clear()
+        self.degree_index = DegreeIndex()
+
+    def clear_edges(self):
+        super().clear_edges()
+        # Every node is left with degree 0
+        self.degree_index = DegreeIndex()
+        for _ in self._adj:
+            self.degree_index.move(None, 0)
+
+    def count_high_degree_nodes(self, threshold: int = 5) -> int:
+        """Nodes with degree greater than threshold, in O(log maxdeg)."""
+        if nx.is_frozen(self):
+            # A view shares another graph's adjacency but has no index of its own
+            return sum(1 for _, degree in self.degree() if degree > threshold)
+        return self.degree_index.count_greater(threshold)
+
+
+# Example test
+if __name__ == "__main__":
+    G = IndexedGraph()
+    G.add_edges_from([
+        (1, 2), (1, 3), (1, 4), (1, 5),
+        (1, 6), (1, 7), (2, 3), (3, 4)
+    ])
+    print("Nodes with degree > 5:", G.count_high_degree_nodes())      # 1
+    print("Nodes with degree > 1:", G.count_high_degree_nodes(1))     # 4
+    G.remove_edge(1, 7)
+    print("After removing (1, 7), degree > 5:", G.count_high_degree_nodes())  # 0
+    G.add_edge(1, 7)
+    # Views have no index of their own, so they are counted directly
+    print("Subgraph view, degree > 5:", G.subgraph(G.nodes).count_high_degree_nodes())  # 1
+    print("Edge subgraph view, degree > 1:",
+          G.edge_subgraph([(1, 2), (2, 3), (1, 3)]).count_high_degree_nodes(1))  # 3
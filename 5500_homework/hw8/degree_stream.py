@@ -0,0 +1,121 @@
+"""Streaming degree counts for edge lists too big to load into an nx.Graph.
+
+count_nodes (easy.py) and count_high_degree_nodes (hard.py) need a fully
+built nx.Graph, which for a 100M-edge list is tens of gigabytes of dicts.
+DegreeCounter reads the edge list a chunk at a time instead, maps each node
+label to a small integer id, and adds the chunk's degrees into a NumPy array
+with np.bincount. Memory is one chunk of edges plus one id (and one int64
+degree) per node.
+
+Degrees match nx.Graph for edge lists without repeated edges (a self-loop
+adds 2, like in NetworkX). Nodes that never appear in an edge cannot be seen.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+def iter_edge_chunks(path: str, chunk_size: int = 1_000_000, comments: str = "#",
+                     delimiter: Optional[str] = None) -> Iterator[List[Tuple[str, str]]]:
+    """Yield lists of (u, v) label pairs from an edge list file, chunk_size edges at a time.
+
+    The format is the one nx.read_edgelist reads: one edge per line, extra
+    columns (weights, data) ignored, text after `comments` skipped.
+    """
+    chunk = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if comments:
+                line = line.split(comments, 1)[0]
+            parts = line.split(delimiter)
+            if len(parts) < 2:
+                continue
+            chunk.append((parts[0], parts[1]))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+class DegreeCounter:
+    """Degree of every node seen in a stream of edges, stored in a NumPy array."""
+
+    def __init__(self, nodetype: type = str):
+        # nodetype converts labels, like nx.read_edgelist(nodetype=int)
+        self.nodetype = nodetype
+        self.ids = {}                             # node label -> integer id
+        self._degrees = np.zeros(1024, dtype=np.int64)
+
+    def add_edges(self, edges: Iterable[Tuple]) -> None:
+        """Count one chunk of (u, v) edges."""
+        labels = np.array([label for edge in edges for label in edge[:2]])
+        if labels.size == 0:
+            return
+        if self.nodetype is int:
+            labels = labels.astype(np.int64)
+        elif self.nodetype is not str:
+            labels = np.array([self.nodetype(label) for label in labels.tolist()], dtype=object)
+
+        # Only the distinct labels of this chunk go through the Python dict;
+        # every endpoint is then mapped with one vectorized lookup
+        uniques, inverse = np.unique(labels, return_inverse=True)
+        ids = self.ids
+        lookup = np.fromiter((ids.setdefault(label, len(ids)) for label in uniques.tolist()),
+                             dtype=np.int64, count=len(uniques))
+
+        n = len(ids)
+        if n > len(self._degrees):
+            grown = np.zeros(max(n, 2 * len(self._degrees)), dtype=np.int64)
+            grown[:len(self._degrees)] = self._degrees
+            self._degrees = grown
+        self._degrees[:n] += np.bincount(lookup[inverse], minlength=n)
+
+    @property
+    def degrees(self) -> np.ndarray:
+        """Degree per node id (ids are in self.ids)."""
+        return self._degrees[:len(self.ids)]
+
+    def number_of_nodes(self) -> int:
+        """Same as count_nodes(G) for the graph built from the edges."""
+        return len(self.ids)
+
+    def count_high_degree_nodes(self, threshold: int = 5) -> int:
+        """Same as count_high_degree_nodes(G): nodes with degree greater than threshold."""
+        return int(np.count_nonzero(self.degrees > threshold))
+
+    def degree_histogram(self) -> List[int]:
+        """Same as nx.degree_histogram(G): list of node counts per degree."""
+        return np.bincount(self.degrees).tolist()
+
+
+def stream_degrees(path: str, chunk_size: int = 1_000_000, nodetype: type = str,
+                   **kwargs) -> DegreeCounter:
+    """Count degrees for a whole edge list file in one pass."""
+    counter = DegreeCounter(nodetype=nodetype)
+    for chunk in iter_edge_chunks(path, chunk_size=chunk_size, **kwargs):
+        counter.add_edges(chunk)
+    return counter
+
+
+# Example test
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    import networkx as nx
+
+    edges = [(1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (2, 3), (3, 4)]
+    path = os.path.join(tempfile.gettempdir(), "hw8_edges.txt")
+    with open(path, "w") as f:
+        f.write("# same graph as hard.py\n")
+        f.writelines(f"{u} {v}\n" for u, v in edges)
+
+    counter = stream_degrees(path, chunk_size=3, nodetype=int)
+    G = nx.read_edgelist(path, nodetype=int)
+    print("Number of nodes:", counter.number_of_nodes(), G.number_of_nodes())
+    print("Nodes with degree > 5:", counter.count_high_degree_nodes(),
+          sum(1 for _, d in G.degree() if d > 5))
+    print("Degree histogram:", counter.degree_histogram(), nx.degree_histogram(G))
+    os.remove(path)
@@ -1,9 +1,20 @@
 
 import networkx as nx
+import numpy as np
 
-def count_high_degree_nodes(graph: nx.Graph) -> int:
-    """Return the number of nodes with degree greater than 5."""
-    return sum(1 for node, degree in graph.degree() if degree > 5)
+from csr_graph import CSRGraph
+from degree_index import IndexedGraph
+
+def count_high_degree_nodes(graph: nx.Graph, threshold: int = 5) -> int:
+    """Return the number of nodes with degree greater than threshold (default 5)."""
+    # IndexedGraph keeps a degree index up to date, so this is O(log maxdeg).
+    # Frozen IndexedGraphs are views (G.subgraph, ...) with an empty index.
+    if isinstance(graph, IndexedGraph) and not nx.is_frozen(graph):
+        return graph.degree_index.count_greater(threshold)
+    # CSRGraph keeps every degree in one array, so count them all at once
+    if isinstance(graph, CSRGraph):
+        return int(np.count_nonzero(graph.degrees > threshold))
+    return sum(1 for node, degree in graph.degree() if degree > threshold)
 
 # Example test
 if __name__ == "__main__":
@@ -12,4 +23,8 @@ if __name__ == "__main__":
         (1, 2), (1, 3), (1, 4), (1, 5),
         (1, 6), (1, 7), (2, 3), (3, 4)
     ])
-    print("Nodes with degree > 5:", count_high_degree_nodes(G))
\ No newline at end of file
+    print("Nodes with degree > 5:", count_high_degree_nodes(G))
+    print("Same on CSR graph:", count_high_degree_nodes(CSRGraph.from_networkx(G)))
+    H = IndexedGraph(G)
+    print("Same on indexed graph:", count_high_degree_nodes(H))
+    print("Same on a subgraph view of it:", count_high_degree_nodes(H.subgraph(H.nodes)))
\ No newline at end of file
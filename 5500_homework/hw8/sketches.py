@@ -0,0 +1,244 @@
+"""Approximate degree statistics for graphs too big to count exactly.
+
+Exact answers (count_nodes, count_high_degree_nodes, or the streaming
+DegreeCounter) need memory for every node. DegreeSketch reads an edge
+stream into small sketches instead:
+
+    HyperLogLog      number of distinct nodes, +/- 1.04/sqrt(2^p) relative error
+    Count-Min        degree of any node, never under, over by at most
+                     eps * (2 * edges) with probability 1 - delta
+    hash sample      exact degrees of a fixed random fraction of nodes, for
+                     "how many nodes have degree > k" with a standard error
+
+The HyperLogLog and Count-Min parts have a fixed size set by p, eps and
+delta. The hash sample is not fixed: it holds about sample_rate * n nodes,
+so its memory grows as O(sample_rate * n). Lower sample_rate for bigger
+graphs (a smaller sample also means a larger error).
+
+Every part is chosen by a hash of the node label, so sketches built from
+different shards of the same edge list (in different processes) merge into
+exactly the sketch of the whole list. sketch_edge_files() does that with a
+process pool. Labels are hashed as given, so use the same label type
+(e.g. all str from files) in every shard.
+"""
+
+import math
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from hashlib import blake2b
+from typing import Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+from degree_stream import iter_edge_chunks
+
+_MASK64 = (1 << 64) - 1
+
+
+class Estimate(NamedTuple):
+    """An approximate answer and its error (see each method for what the error means)."""
+    value: float
+    error: float
+
+
+def _hash128(item: Hashable) -> Tuple[int, int]:
+    """Two independent 64-bit hashes, the same in every process (unlike hash())."""
+    digest = blake2b(repr(item).encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+
+class HyperLogLog:
+    """Distinct-count sketch with 2^p one-byte registers."""
+
+    def __init__(self, p: int = 14):
+        if not 4 <= p <= 18:
+            raise ValueError("p must be between 4 and 18.")
+        self.p = p
+        self.registers = bytearray(1 << p)
+
+    def add_hash(self, h: int) -> None:
+        # Top p bits pick the register; the rest give the rank of the first 1 bit
+        rest_bits = 64 - self.p
+        index = h >> rest_bits
+        rest = h & ((1 << rest_bits) - 1)
+        rank = rest_bits - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def add(self, item: Hashable) -> None:
+        self.add_hash(_hash128(item)[0])
+
+    def count(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)  # small-range (linear counting) correction
+        return raw
+
+    def relative_error(self) -> float:
+        """Standard error of count(), as a fraction of the count."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if self.p != other.p:
+            raise ValueError("Cannot merge HyperLogLogs with different p.")
+        merged = HyperLogLog(self.p)
+        merged.registers = bytearray(map(max, self.registers, other.registers))
+        return merged
+
+
+class CountMinSketch:
+    """Frequency sketch: depth rows of width counters; an estimate is the row minimum."""
+
+    def __init__(self, eps: float = 1e-4, delta: float = 1e-3):
+        self.eps = eps
+        self.delta = delta
+        self.width = math.ceil(math.e / eps)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.rows = [array("q", [0]) * self.width for _ in range(self.depth)]
+        self.total = 0
+
+    def _columns(self, h1: int, h2: int) -> Iterable[int]:
+        # Double hashing: row i uses h1 + i * h2
+        width = self.width
+        return ((h1 + i * h2) % width for i in range(self.depth))
+
+    def add_hash(self, h1: int, h2: int, count: int = 1) -> None:
+        for row, col in zip(self.rows, self._columns(h1, h2)):
+            row[col] += count
+        self.total += count
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        self.add_hash(*_hash128(item), count)
+
+    def estimate(self, item: Hashable) -> int:
+        """Never below the true count; above it by <= eps * total with prob. 1 - delta."""
+        h1, h2 = _hash128(item)
+        return min(row[col] for row, col in zip(self.rows, self._columns(h1, h2)))
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Cannot merge Count-Min sketches of different shapes.")
+        merged = CountMinSketch(self.eps, self.delta)
+        merged.rows = [array("q", map(int.__add__, a, b)) for a, b in zip(self.rows, other.rows)]
+        merged.total = self.total + other.total
+        return merged
+
+
+class DegreeSketch:
+    """Approximate node count, per-node degree and degree-threshold counts from an edge stream."""
+
+    def __init__(self, p: int = 14, eps: float = 1e-4, delta: float = 1e-3,
+                 sample_rate: float = 0.01):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1].")
+        self.nodes = HyperLogLog(p)
+        self.degrees = CountMinSketch(eps, delta)
+        self.sample_rate = sample_rate
+        self._cutoff = int(sample_rate * (1 << 32))
+        self.sample = {}  # node -> exact degree, for ~sample_rate * n sampled nodes
+        self.edges = 0
+
+    def _add_endpoint(self, node: Hashable, count: int) -> None:
+        h1, h2 = _hash128(node)
+        self.nodes.add_hash(h1)
+        self.degrees.add_hash(h1, h2, count)
+        # A node is sampled (or not) by its hash, so it is sampled in every shard
+        if (h2 & 0xFFFFFFFF) < self._cutoff:
+            self.sample[node] = self.sample.get(node, 0) + count
+
+    def add_edge(self, u: Hashable, v: Hashable) -> None:
+        self.edges += 1
+        if u == v:
+            self._add_endpoint(u, 2)  # a self-loop adds 2, like nx.Graph
+        else:
+            self._add_endpoint(u, 1)
+            self._add_endpoint(v, 1)
+
+    def add_edges(self, edges: Iterable[Tuple]) -> None:
+        for edge in edges:
+            self.add_edge(edge[0], edge[1])
+
+    def number_of_nodes(self) -> Estimate:
+        """Approximate count_nodes(G); error is one standard error."""
+        count = self.nodes.count()
+        return Estimate(count, count * self.nodes.relative_error())
+
+    def degree(self, node: Hashable) -> Estimate:
+        """Approximate degree; the true degree is in [value - error, value] w.p. 1 - delta."""
+        return Estimate(self.degrees.estimate(node), self.degrees.eps * self.degrees.total)
+
+    def count_high_degree_nodes(self, threshold: int = 5) -> Estimate:
+        """Approximate count_high_degree_nodes(G, threshold); error is one standard error."""
+        hits = sum(1 for d in self.sample.values() if d > threshold)
+        rate = self.sample_rate
+        return Estimate(hits / rate, math.sqrt(hits * (1 - rate)) / rate)
+
+    def merge(self, other: "DegreeSketch") -> "DegreeSketch":
+        """Sketch of both edge streams together."""
+        if self.sample_rate != other.sample_rate:
+            raise ValueError("Cannot merge sketches with different sample rates.")
+        merged = DegreeSketch.__new__(DegreeSketch)
+        merged.nodes = self.nodes.merge(other.nodes)
+        merged.degrees = self.degrees.merge(other.degrees)
+        merged.sample_rate = self.sample_rate
+        merged._cutoff = self._cutoff
+        merged.sample = dict(self.sample)
+        for node, d in other.sample.items():
+            merged.sample[node] = merged.sample.get(node, 0) + d
+        merged.edges = self.edges + other.edges
+        return merged
+
+
+def _sketch_file(path: str, options: dict) -> DegreeSketch:
+    """Worker: sketch one edge list file."""
+    sketch = DegreeSketch(**options)
+    for chunk in iter_edge_chunks(path):
+        sketch.add_edges(chunk)
+    return sketch
+
+
+def sketch_edge_files(paths: List[str], workers: Optional[int] = None, **options) -> DegreeSketch:
+    """Sketch several edge list shards in parallel and merge the results.
+
+    options are passed to DegreeSketch (p, eps, delta, sample_rate) and must
+    be the same for every shard, which this function guarantees.
+    """
+    if not paths:
+        return DegreeSketch(**options)
+    if workers == 1 or len(paths) == 1:
+        return reduce(DegreeSketch.merge, (_sketch_file(path, options) for path in paths))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return reduce(DegreeSketch.merge, pool.map(_sketch_file, paths, [options] * len(paths)))
+
+
+# Example test
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    import networkx as nx
+
+    G = nx.barabasi_albert_graph(50_000, 3, seed=5500)
+    edges = [(str(u), str(v)) for u, v in G.edges()]
+
+    # Write the edges as 4 shards and sketch them in parallel
+    folder = tempfile.mkdtemp()
+    paths = []
+    for i in range(4):
+        path = os.path.join(folder, f"shard{i}.txt")
+        with open(path, "w") as f:
+            f.writelines(f"{u} {v}\n" for u, v in edges[i::4])
+        paths.append(path)
+
+    sketch = sketch_edge_files(paths, sample_rate=0.05)
+    exact_high = sum(1 for _, d in G.degree() if d > 5)
+    print("Nodes: exact", G.number_of_nodes(), "estimate %.0f +/- %.0f" % sketch.number_of_nodes())
+    print("Degree > 5: exact", exact_high,
+          "estimate %.0f +/- %.0f" % sketch.count_high_degree_nodes(5))
+    print("Degree of node 0: exact", G.degree(0), "estimate %d (-%.1f)" % sketch.degree("0"))
+
+    for path in paths:
+        os.remove(path)
+    os.rmdir(folder)
@@ -17,9 +17,17 @@ Searches for cryptocurrency arbitrage opportunities using a directed graph.
     * best (maximum) forward path per ordered currency pair
 """
 
+import os  # used to find the folder with instrument.py
+import sys  # used to make instrument.py importable
+
 import requests  # used to call the CoinGecko HTTP API
 import networkx as nx  # used to build and analyze a directed graph
 
+# instrument.py (shared stage timing) lives one folder up. It is appended
+# to the end of sys.path, so that folder can't shadow any other module.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instrument import add_bytes, dump_from_env, timed  # opt-in stage timing
+
 
 # Base URL for the CoinGecko simple price API
 COINGECKO_URL = "https://api.coingecko.com/api/v3/simple/price"
@@ -43,6 +51,7 @@ IDS = ",".join(ID_TO_TICKER.keys())
 VS_CURRENCIES = "eth,btc,ltc,xrp,ada,bch,eos"
 
 
+@timed("fetch_prices")
 def fetch_prices():
     """
     Fetch the most recent exchange rates for the chosen coins from CoinGecko.
@@ -63,10 +72,14 @@ def fetch_prices():
     # Raise an exception if the HTTP request failed (non-2xx status code)
     response.raise_for_status()
 
+    # Record how many bytes were downloaded (only counted when instrumentation is on)
+    add_bytes(len(response.content))
+
     # Parse and return the JSON response as a Python dictionary
     return response.json()
 
 
+@timed("build_graph")
 def build_graph(price_data):
     """
     Build a directed weighted graph from the CoinGecko price data.
@@ -112,7 +125,9 @@ def compute_path_weight(graph, path):
     If any edge in the path does not exist in the directed graph, return None.
 
     Args:
-        graph (nx.DiGraph): Graph containing the nodes and edges.
+        graph (nx.DiGraph or CSRGraph): Graph containing the nodes and edges.
+            Any graph with has_edge(u, v) and graph[u][v] works, including
+            the compact CSRGraph from hw8/csr_graph.py.
         path (list[str]): List of node names in order, e.g. ['btc', 'xrp', 'eth'].
 
     Returns:
@@ -146,38 +161,22 @@ def compute_path_weight(graph, path):
     return weight_product
 
 
-def main():
-    """
-    Main function that:
-    - fetches prices
-    - builds the graph
-    - scans all paths between all ordered currency pairs
-    - prints every path with forward and reverse weights and factor
-    - tracks smallest and greatest factors across the entire graph
-    - tracks and prints the best forward path for each currency pair
+@timed("pair_scan")
+def scan_pairs(graph, tickers):
     """
-    # Print a simple status message before calling the API
-    print("Fetching latest prices from CoinGecko...")
+    Scan all paths between every ordered pair of tickers.
 
-    # Call the API and store the price data dictionary
-    price_data = fetch_prices()
+    Prints every path with its forward and reverse weights and factor, and
+    the best forward path for each currency pair.
 
-    # Build the directed weighted graph from the price data
-    graph = build_graph(price_data)
-
-    # Print the list of graph nodes (currency tickers)
-    print("Graph nodes (currencies):")
-    print(list(graph.nodes))
-
-    # Print the total number of nodes in the graph
-    print("\nNumber of nodes:", graph.number_of_nodes())
-
-    # Print the total number of edges in the graph
-    print("Number of edges:", graph.number_of_edges(), "\n")
-
-    # Get a simple list of all ticker nodes in the graph
-    tickers = list(graph.nodes)
+    Args:
+        graph (nx.DiGraph): Graph built by build_graph.
+        tickers (list[str]): Ticker nodes to pair up.
 
+    Returns:
+        tuple: (smallest, greatest), each a tuple (factor, forward_path,
+        reverse_path); every value is None if no factor was found.
+    """
     # Initialize the smallest arbitrage factor across all paths to None
     smallest_factor = None
     # Initialize the forward path associated with the smallest factor
@@ -286,6 +285,50 @@ def main():
             # Print a blank line to separate this pair from the next one
             print()
 
+    # Return the smallest and greatest factors with their paths
+    return (
+        (smallest_factor, smallest_forward_path, smallest_reverse_path),
+        (greatest_factor, greatest_forward_path, greatest_reverse_path),
+    )
+
+
+def main():
+    """
+    Main function that:
+    - fetches prices
+    - builds the graph
+    - scans all paths between all ordered currency pairs
+    - prints every path with forward and reverse weights and factor
+    - tracks smallest and greatest factors across the entire graph
+    - tracks and prints the best forward path for each currency pair
+    """
+    # Print a simple status message before calling the API
+    print("Fetching latest prices from CoinGecko...")
+
+    # Call the API and store the price data dictionary
+    price_data = fetch_prices()
+
+    # Build the directed weighted graph from the price data
+    graph = build_graph(price_data)
+
+    # Print the list of graph nodes (currency tickers)
+    print("Graph nodes (currencies):")
+    print(list(graph.nodes))
+
+    # Print the total number of nodes in the graph
+    print("\nNumber of nodes:", graph.number_of_nodes())
+
+    # Print the total number of edges in the graph
+    print("Number of edges:", graph.number_of_edges(), "\n")
+
+    # Get a simple list of all ticker nodes in the graph
+    tickers = list(graph.nodes)
+
+    # Scan every currency pair and get the smallest and greatest factors
+    smallest, greatest = scan_pairs(graph, tickers)
+    smallest_factor, smallest_forward_path, smallest_reverse_path = smallest
+    greatest_factor, greatest_forward_path, greatest_reverse_path = greatest
+
     # After all currency pairs have been processed, print a summary header
     print("Summary of arbitrage factors")
 
@@ -305,5 +348,10 @@ def main():
 
 # Only run the main function when this file is executed directly
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # Write stage timings if HW_INSTRUMENT is set (see instrument.py),
+        # also when main() stopped with an error
+        dump_from_env()
 
@@ -0,0 +1,232 @@
+"""
+instrument.py
+
+Opt-in timing for the stages of the homework pipelines (hw5 covid_api.py,
+hw9 crypto.py).
+
+- @timed("name") wraps a function, `with stage("name"):` wraps a block
+- Per stage it records: call count, total and max wall time, bytes
+  read/fetched (reported with add_bytes) and, optionally, peak traced memory
+- Results live in an in-process registry and can be dumped as JSON or in
+  the Prometheus text exposition format
+
+Nothing is recorded unless instrumentation is turned on, either in code
+with enable() or with the HW_INSTRUMENT environment variable:
+
+    HW_INSTRUMENT=1    time stages
+    HW_INSTRUMENT=mem  time stages and track peak memory (tracemalloc, slower)
+    HW_INSTRUMENT_OUT=metrics.json (or .prom) where dump_from_env() writes;
+                       default is stderr as JSON
+
+When it is off, a timed function costs one extra call and one flag check.
+"""
+
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+
+class StageStats:
+    """Everything recorded for one stage name."""
+
+    __slots__ = ("calls", "seconds", "max_seconds", "bytes", "peak_memory")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes = 0
+        self.peak_memory = 0
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "max_seconds": self.max_seconds,
+            "bytes": self.bytes,
+            "peak_memory_bytes": self.peak_memory,
+        }
+
+
+class _Stage:
+    """Context manager for one run of a stage."""
+
+    __slots__ = ("registry", "name", "start", "peak")
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        registry = self.registry
+        if registry.trace_memory:
+            # Hand the peak so far to the enclosing stage before resetting it
+            if registry.stack:
+                parent = registry.stack[-1]
+                parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self.peak = 0
+        registry.stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        registry = self.registry
+        registry.stack.pop()
+        stats = registry.stats_for(self.name)
+        stats.calls += 1
+        stats.seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        if registry.trace_memory:
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            stats.peak_memory = max(stats.peak_memory, self.peak)
+            if registry.stack:
+                parent = registry.stack[-1]
+                parent.peak = max(parent.peak, self.peak)
+        return False
+
+
+class _NoStage:
+    """Stand-in used while instrumentation is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NO_STAGE = _NoStage()
+
+
+class Registry:
+    """Holds the per-stage statistics of this process."""
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.stats = {}
+        self.stack = []
+
+    def enable(self, trace_memory=False):
+        """Start recording (trace_memory also tracks peak memory per stage)."""
+        self.enabled = True
+        self.trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        """Stop recording (already recorded statistics are kept)."""
+        self.enabled = False
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.trace_memory = False
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        self.stats = {}
+        self.stack = []
+
+    def stats_for(self, name):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = StageStats()
+        return stats
+
+    def stage(self, name):
+        """Context manager timing the block inside it as one call of `name`."""
+        if not self.enabled:
+            return _NO_STAGE
+        return _Stage(self, name)
+
+    def timed(self, name=None):
+        """Decorator timing every call of a function (name defaults to the function name)."""
+        def decorate(func):
+            stage_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Stage(self, stage_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def add_bytes(self, count, name=None):
+        """Add bytes read/fetched to a stage (default: the innermost running stage)."""
+        if not self.enabled:
+            return
+        if name is None:
+            if not self.stack:
+                return
+            name = self.stack[-1].name
+        self.stats_for(name).bytes += count
+
+    # ---------- Output ----------
+    def snapshot(self):
+        """All statistics as a plain dict: {stage name: {field: value}}."""
+        return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_prometheus(self, prefix="hw_stage"):
+        """Statistics in the Prometheus text exposition format."""
+        metrics = [
+            ("calls_total", "counter", "Number of times the stage ran.", "calls"),
+            ("seconds_total", "counter", "Total wall time spent in the stage.", "seconds"),
+            ("seconds_max", "gauge", "Longest single run of the stage.", "max_seconds"),
+            ("bytes_total", "counter", "Bytes read or fetched by the stage.", "bytes"),
+            ("peak_memory_bytes", "gauge", "Peak traced memory during the stage.", "peak_memory"),
+        ]
+        lines = []
+        for suffix, kind, help_text, field in metrics:
+            metric = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name in sorted(self.stats):
+                label = name.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                value = getattr(self.stats[name], field)
+                lines.append(f'{metric}{{stage="{label}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path=None, fmt="json"):
+        """Write the statistics to a file (or stderr if path is None)."""
+        text = self.to_prometheus() if fmt == "prometheus" else self.to_json() + "\n"
+        if path is None:
+            sys.stderr.write(text)
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+# The registry for this process, set up from the environment
+registry = Registry()
+_mode = os.environ.get("HW_INSTRUMENT", "").strip().lower()
+if _mode in ("1", "true", "yes", "on"):
+    registry.enable()
+elif _mode in ("mem", "memory"):
+    registry.enable(trace_memory=True)
+
+# Shortcuts so pipelines can write `@timed("fetch")` and `with stage("scan"):`
+enable = registry.enable
+disable = registry.disable
+stage = registry.stage
+timed = registry.timed
+add_bytes = registry.add_bytes
+
+
+def dump_from_env():
+    """If instrumentation is on, write the statistics where HW_INSTRUMENT_OUT says."""
+    if not registry.enabled:
+        return
+    path = os.environ.get("HW_INSTRUMENT_OUT") or None
+    fmt = "prometheus" if path and path.endswith(".prom") else "json"
+    registry.dump(path, fmt)